@@ -3,14 +3,22 @@ Network God Game Engine AI Behavior System
 NPC and entity AI behaviors with self-improvement capabilities
 """
 
+import os
+import sys
 import time
+import logging
+import pickle
 import random
-import math
-from typing import Dict, List, Tuple, Callable
+import heapq
+import threading
+from collections import deque
+from typing import Dict, List, Set, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from .engine_core import EngineSystem
 
+_LOG = logging.getLogger(__name__)
+
 class BehaviorState(Enum):
     IDLE = 1
     PATROL = 2
@@ -27,7 +35,13 @@ class BehaviorType(Enum):
     SOCIAL = 4
     INTELLECTUAL = 5
 
-@dataclass
+class BehaviorPriority(Enum):
+    # Entities update every 2 ** value AI ticks
+    HIGH = 0  # Bosses, quest NPCs
+    NORMAL = 2
+    LOW = 4  # Ambient crowd
+
+@dataclass(slots=True)
 class BehaviorSettings:
     update_rate: float = 0.1  # Seconds between behavior updates
     perception_range: float = 20.0  # How far entities can perceive
@@ -35,8 +49,11 @@ class BehaviorSettings:
     learning_rate: float = 0.01  # Rate of behavior adaptation
     enable_group_behavior: bool = True
     enable_emotional_states: bool = True
+    persist_learned_state: bool = False  # Save/restore learned models across sessions
+    learned_state_dir: str = ".cache"
+    learned_state_save_interval: int = 1000  # Learning cycles between saves
 
-@dataclass
+@dataclass(slots=True)
 class EntityState:
     position: Tuple[float, float, float] = (0.0, 0.0, 0.0)
     rotation: Tuple[float, float, float] = (0.0, 0.0, 0.0)
@@ -46,7 +63,7 @@ class EntityState:
     last_action: str = "idle"
     action_cooldown: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class BehaviorProfile:
     behavior_type: BehaviorType
     aggression: float = 0.5  # 0.0 to 1.0
@@ -54,10 +71,11 @@ class BehaviorProfile:
     sociality: float = 0.5  # 0.0 to 1.0
     curiosity: float = 0.5  # 0.0 to 1.0
     fear: float = 0.3  # 0.0 to 1.0
+    priority: BehaviorPriority = BehaviorPriority.HIGH
     memory: Dict[str, float] = field(default_factory=dict)  # Experience memory
     preferences: Dict[str, float] = field(default_factory=dict)  # Action preferences
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     id: str
     state: EntityState
@@ -66,7 +84,7 @@ class Entity:
     goals: List[str] = field(default_factory=list)
     relationships: Dict[str, float] = field(default_factory=dict)  # Entity ID to relationship value
 
-@dataclass
+@dataclass(slots=True)
 class BehaviorStats:
     entities_count: int = 0
     active_behaviors: int = 0
@@ -75,6 +93,29 @@ class BehaviorStats:
     successful_interactions: int = 0
     failed_interactions: int = 0
 
+def _collect_rows_in_range(candidates: List[int], pos_x: List[float], pos_y: List[float],
+                           pos_z: List[float], x: float, y: float, z: float,
+                           range_sq: float, skip_row: int, out: List[int]):
+    """Append candidate rows within sqrt(range_sq) of (x, y, z) to out"""
+    for row in candidates:
+        if row == skip_row:
+            continue
+        dx = x - pos_x[row]
+        dy = y - pos_y[row]
+        dz = z - pos_z[row]
+        if dx * dx + dy * dy + dz * dz <= range_sq:
+            out.append(row)
+
+# Interned behavior names so memory-dict lookups hit the identity fast path
+_BEHAVIOR_NAMES = {name: sys.intern(name) for name in (
+    "attack", "flee", "interact", "patrol", "wander", "explore", "seek_social", "idle")}
+
+# Bump when the pickled learned-state layout changes
+_LEARNED_STATE_VERSION = 1
+
+# Cooldowns below this are treated as expired to absorb float drift
+_WAKE_EPSILON = 1e-9
+
 class AIBehaviorSystem(EngineSystem):
     def __init__(self):
         self.settings = BehaviorSettings()
@@ -82,9 +123,63 @@ class AIBehaviorSystem(EngineSystem):
         self.entities: Dict[str, Entity] = {}
         self.behavior_trees = {}
         self.stimuli = {}
-        self.last_update_time = 0.0
-        self.response_times = []
+        self.last_update_time = float("-inf")  # perf_counter() seconds
         self.max_response_times = 100
+        self.response_times = deque(maxlen=self.max_response_times)
+        self._response_time_sum = 0.0
+        self._recent_response_times = deque(maxlen=30)  # Window for get_performance_rating
+        self._recent_response_sum = 0.0
+        
+        # Recent behavior outcomes for windowed success rate
+        self.max_recent_outcomes = 1000
+        self._recent_outcomes = deque(maxlen=self.max_recent_outcomes)
+        self._recent_successes = 0
+        
+        # Spatial index (uniform grid keyed on perception range)
+        self._spatial_grid: Dict[Tuple[int, int, int], List[int]] = None
+        self._spatial_cell_size = self.settings.perception_range
+        self._perception_r2 = 0.0
+        self._communication_r2 = 0.0
+        self._refresh_ranges()
+        
+        # Entity mutations arriving mid-tick are queued and applied next tick
+        self._entities_lock = threading.RLock()
+        self._in_tick = False
+        self._pending_ops: List[Tuple[Callable, tuple]] = []
+        
+        # Behavior selection lookup table
+        self._behavior_lut = self._build_behavior_lut()
+        # Behavior name -> (handler, execution time)
+        self._exec_dispatch: Dict[str, Tuple[Callable[[Entity], bool], float]] = {
+            "attack": (self._execute_attack, 1.0),
+            "flee": (self._execute_flee, 0.8),
+            "interact": (self._execute_interaction, 1.5),
+            "patrol": (self._execute_patrol, 2.0),
+            "wander": (self._execute_wander, 1.2),
+            "explore": (self._execute_explore, 2.5),
+            "seek_social": (self._execute_seek_social, 1.8),
+        }
+        
+        # Hot entity state as parallel columns, rebuilt with the spatial index
+        self._rows: List[Entity] = []
+        self._row_of: Dict[str, int] = {}
+        self._pos_x: List[float] = []
+        self._pos_y: List[float] = []
+        self._pos_z: List[float] = []
+        self._faction_id: List[int] = []
+        self._aggressive: List[bool] = []
+        
+        # Factions interned to small ints with a faction x faction hostility table
+        self._faction_id_of: Dict[str, int] = {}
+        self._hostile: List[List[bool]] = []
+        
+        # Incremental scheduling: only dirty or waking entities are visited
+        self._sim_time = 0.0
+        self._tick = 0
+        self._dirty: Set[str] = set()
+        self._wake_heap: List[Tuple[float, str]] = []  # (wake_time, entity_id)
+        self._wake_at: Dict[str, float] = {}
+        self._last_visit: Dict[str, float] = {}
         
         # Self-improvement components
         self.learning_enabled = True
@@ -94,16 +189,63 @@ class AIBehaviorSystem(EngineSystem):
         
     def initialize(self):
         """Initialize the AI behavior system"""
-        print("Initializing AI Behavior System...")
-        print(f"  Update Rate: {self.settings.update_rate}s")
-        print(f"  Perception Range: {self.settings.perception_range}")
-        print(f"  Learning Rate: {self.settings.learning_rate}")
-        print(f"  Group Behavior: {'Enabled' if self.settings.enable_group_behavior else 'Disabled'}")
+        _LOG.info("Initializing AI Behavior System...")
+        _LOG.info("  Update Rate: %ss", self.settings.update_rate)
+        _LOG.info("  Perception Range: %s", self.settings.perception_range)
+        _LOG.info("  Learning Rate: %s", self.settings.learning_rate)
+        _LOG.info("  Group Behavior: %s", 'Enabled' if self.settings.enable_group_behavior else 'Disabled')
+        
+        # Square perception/communication ranges once for distance checks
+        self._refresh_ranges()
         
         # Create default behavior trees
         self._create_default_behavior_trees()
         
-        print("AI Behavior System initialized successfully")
+        if self.settings.persist_learned_state:
+            self._load_learned_state()
+        
+        _LOG.info("AI Behavior System initialized successfully")
+        
+    def shutdown(self):
+        """Shutdown the AI behavior system"""
+        if self.settings.persist_learned_state:
+            self._save_learned_state()
+        
+    def _refresh_ranges(self):
+        """Recompute cached squared ranges after a settings change"""
+        self._perception_r2 = self.settings.perception_range ** 2
+        self._communication_r2 = self.settings.communication_range ** 2
+        self._spatial_grid = None
+        
+    def _learned_state_path(self) -> str:
+        """Location of the pickled learned state for the current schema"""
+        return os.path.join(self.settings.learned_state_dir,
+                            f"ai_learned_state_v{_LEARNED_STATE_VERSION}.pkl")
+        
+    def _load_learned_state(self):
+        """Restore behavior models and performance history from a previous session"""
+        try:
+            with open(self._learned_state_path(), "rb") as f:
+                self.behavior_models, self.performance_history = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except (pickle.UnpicklingError, EOFError, ValueError) as e:
+            _LOG.warning("Ignoring unreadable AI learned state: %s", e)
+            return
+        _LOG.info("Restored %d learned behavior models", len(self.behavior_models))
+        
+    def _save_learned_state(self):
+        """Atomically write behavior models and performance history to disk"""
+        path = self._learned_state_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.settings.learned_state_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump((self.behavior_models, self.performance_history), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _LOG.warning("Failed to save AI learned state: %s", e)
         
     def _create_default_behavior_trees(self):
         """Create default behavior tree templates"""
@@ -135,14 +277,13 @@ class AIBehaviorSystem(EngineSystem):
         
     def update(self, delta_time: float):
         """Update the AI behavior system"""
-        current_time = time.time()
+        # One monotonic clock read serves both the rate gate and the timing
+        now = time.perf_counter()
         
         # Only update at the specified rate
-        if current_time - self.last_update_time < self.settings.update_rate:
+        if now - self.last_update_time < self.settings.update_rate:
             return
             
-        update_start = time.time()
-        
         # Update all entities
         self._update_entities(delta_time)
         
@@ -154,29 +295,129 @@ class AIBehaviorSystem(EngineSystem):
             self._adapt_behaviors()
             
         # Update statistics
-        self.last_update_time = current_time
-        response_time = time.time() - update_start
+        self.last_update_time = now
+        response_time = time.perf_counter() - now
+        if len(self.response_times) == self.response_times.maxlen:
+            self._response_time_sum -= self.response_times[0]
         self.response_times.append(response_time)
-        if len(self.response_times) > self.max_response_times:
-            self.response_times.pop(0)
-            
-        self.stats.avg_response_time = sum(self.response_times) / len(self.response_times) if self.response_times else 0
+        self._response_time_sum += response_time
+        recent = self._recent_response_times
+        if len(recent) == recent.maxlen:
+            self._recent_response_sum -= recent[0]
+        recent.append(response_time)
+        self._recent_response_sum += response_time
+        
+        self.stats.avg_response_time = self._response_time_sum / len(self.response_times)
         self.stats.entities_count = len(self.entities)
         
     def _update_entities(self, delta_time: float):
-        """Update all entities' behaviors"""
-        for entity in self.entities.values():
-            # Update entity state
-            self._update_entity_state(entity, delta_time)
-            
-            # Select and execute behavior
-            behavior = self._select_behavior(entity)
-            self._execute_behavior(entity, behavior)
-            
-            # Update relationships and memory
-            self._update_relationships(entity)
-            self._update_memory(entity)
+        """Update entities, deferring concurrent adds/removes until the next tick"""
+        with self._entities_lock:
+            self._flush_pending_ops()
+            self._in_tick = True
+        try:
+            self._tick_entities(delta_time)
+        finally:
+            with self._entities_lock:
+                self._in_tick = False
+                
+    def _tick_entities(self, delta_time: float):
+        """Update behaviors of entities that are dirty or whose cooldown expired"""
+        # Bucket entity positions once so perception queries stay local
+        self._rebuild_spatial_index()
+        
+        self._sim_time += delta_time
+        self._tick += 1
+        now = self._sim_time
+        tick = self._tick
+        active = self._collect_active_entities(now)
+        self._dirty = set()
+        self.stats.active_behaviors = len(active)
+        
+        visits = []
+        for entity_id in active:
+            entity = self.entities.get(entity_id)
+            if entity is None:
+                continue
+                
+            # Lower priority tiers only think every few ticks
+            if tick & ((1 << entity.behavior.priority.value) - 1):
+                self._dirty.add(entity_id)
+                continue
+                
+            # Entities catch up on the time slept since their last visit
+            elapsed = now - self._last_visit.get(entity_id, now - delta_time)
+            self._last_visit[entity_id] = now
+            visits.append((entity_id, entity, elapsed))
             
+        results = self._visit_entities(visits)
+        
+        # Merge outcomes and reschedule
+        rows = self._rows
+        successes = failures = 0
+        for (entity_id, entity, _), (outcome, nearby_rows) in zip(visits, results):
+            if outcome is True:
+                successes += 1
+                self._record_outcome(True)
+            elif outcome is False:
+                failures += 1
+                self._record_outcome(False)
+                
+            cooldown = entity.state.action_cooldown
+            if cooldown <= 0:
+                self._dirty.add(entity_id)
+            elif nearby_rows is not None:
+                # Sleep until the cooldown expires and let neighbours react
+                self._schedule_wake(entity_id, now + cooldown)
+                self._dirty.update(rows[r].id for r in nearby_rows)
+            elif entity_id not in self._wake_at:
+                self._schedule_wake(entity_id, now + cooldown)
+                
+        self.stats.successful_interactions += successes
+        self.stats.failed_interactions += failures
+        
+    def _visit_entities(self, visits: List[Tuple[str, Entity, float]]) -> List[Tuple[bool, List[int]]]:
+        """Visit a batch of entities; see _visit_entity"""
+        visit = self._visit_entity
+        return [visit(entity, elapsed) for _, entity, elapsed in visits]
+        
+    def _visit_entity(self, entity: Entity, elapsed: float) -> Tuple[bool, List[int]]:
+        """Advance one entity, returning (behavior outcome, nearby rows if it acted)"""
+        # Update entity state
+        self._update_entity_state(entity, elapsed)
+        if entity.state.action_cooldown > _WAKE_EPSILON:
+            return None, None  # Woken by a neighbour but still in cooldown
+        entity.state.action_cooldown = 0.0
+        
+        # Select and execute behavior
+        nearby_rows = self._get_nearby_rows(entity)
+        behavior = self._select_behavior(entity, nearby_rows)
+        outcome = self._execute_behavior(entity, behavior)
+        
+        # Update relationships and memory
+        self._update_relationships(entity)
+        self._update_memory(entity)
+        
+        return outcome, (nearby_rows if entity.state.action_cooldown > 0 else None)
+        
+    def _collect_active_entities(self, now: float) -> Set[str]:
+        """Pop entities whose wake time has passed and merge them with the dirty set"""
+        active = set(self._dirty)
+        heap = self._wake_heap
+        wake_at = self._wake_at
+        while heap and heap[0][0] <= now:
+            wake_time, entity_id = heapq.heappop(heap)
+            # Skip entries superseded by a later reschedule or removal
+            if wake_at.get(entity_id) == wake_time:
+                del wake_at[entity_id]
+                active.add(entity_id)
+        return active
+        
+    def _schedule_wake(self, entity_id: str, wake_time: float):
+        """Schedule an entity to be revisited at the given simulation time"""
+        self._wake_at[entity_id] = wake_time
+        heapq.heappush(self._wake_heap, (wake_time, entity_id))
+        
     def _update_entity_state(self, entity: Entity, delta_time: float):
         """Update entity state"""
         # Reduce action cooldown
@@ -187,140 +428,211 @@ class AIBehaviorSystem(EngineSystem):
         entity.state.energy = min(100.0, entity.state.energy + delta_time * 0.1)
         entity.state.health = min(100.0, entity.state.health + delta_time * 0.05)
         
-    def _select_behavior(self, entity: Entity) -> str:
+    def _select_behavior(self, entity: Entity, nearby_rows: List[int] = None) -> str:
         """Select appropriate behavior for entity"""
-        # Get nearby entities
-        nearby_entities = self._get_nearby_entities(entity)
-        
-        # Check for threats
-        threats = [e for e in nearby_entities if self._is_threat(entity, e)]
+        # Get nearby entity rows
+        if nearby_rows is None:
+            nearby_rows = self._get_nearby_rows(entity)
+        my_faction = self._intern_faction(entity.faction)
+        hostile = self._hostile[my_faction]
+        faction_ids = self._faction_id
+        aggressive = self._aggressive
+        
+        # Check for threats (stops at the first hit)
+        has_threats = any(aggressive[r] and hostile[faction_ids[r]] for r in nearby_rows)
+        
+        # Check for friends (stops at the first hit)
+        relationships = entity.relationships
+        rows = self._rows
+        has_friends = any(faction_ids[r] == my_faction for r in nearby_rows) or (
+            bool(relationships)
+            and any(relationships.get(rows[r].id, 0) > 0 for r in nearby_rows)
+        )
         
-        # Check for friends
-        friends = [e for e in nearby_entities if self._is_friend(entity, e)]
+        return self._behavior_lut[(entity.behavior.behavior_type, has_threats, has_friends)]
         
-        # Behavior selection based on entity type and situation
-        if entity.behavior.behavior_type == BehaviorType.AGGRESSIVE:
-            if threats:
+    @staticmethod
+    def _decide_behavior(behavior_type: BehaviorType, has_threats: bool, has_friends: bool) -> str:
+        """Behavior selection based on entity type and situation"""
+        if behavior_type == BehaviorType.AGGRESSIVE:
+            if has_threats:
                 return "attack"
-            elif friends:
+            elif has_friends:
                 return "patrol"
             else:
                 return "wander"
-        elif entity.behavior.behavior_type == BehaviorType.SOCIAL:
-            if friends:
+        elif behavior_type == BehaviorType.SOCIAL:
+            if has_friends:
                 return "interact"
             else:
                 return "seek_social"
-        elif entity.behavior.behavior_type == BehaviorType.DEFENSIVE:
-            if threats:
+        elif behavior_type == BehaviorType.DEFENSIVE:
+            if has_threats:
                 return "flee"
             else:
                 return "patrol"
         else:  # PASSIVE or INTELLECTUAL
             return "explore"
             
-    def _execute_behavior(self, entity: Entity, behavior: str):
-        """Execute selected behavior"""
+    def _build_behavior_lut(self) -> Dict[Tuple[BehaviorType, bool, bool], str]:
+        """Precompute behavior selection for every (type, threats, friends) combination"""
+        return {
+            (behavior_type, has_threats, has_friends): self._decide_behavior(
+                behavior_type, has_threats, has_friends
+            )
+            for behavior_type in BehaviorType
+            for has_threats in (False, True)
+            for has_friends in (False, True)
+        }
+        
+    def _execute_behavior(self, entity: Entity, behavior: str) -> bool:
+        """Execute selected behavior, returning its success or None while cooling down"""
         if entity.state.action_cooldown > 0:
-            return  # Still in cooldown period
+            return None  # Still in cooldown period
             
         # Execute behavior with some randomness
-        success = True
-        execution_time = 0.0
-        
-        if behavior == "attack":
-            success = self._execute_attack(entity)
-            execution_time = 1.0
-        elif behavior == "flee":
-            success = self._execute_flee(entity)
-            execution_time = 0.8
-        elif behavior == "interact":
-            success = self._execute_interaction(entity)
-            execution_time = 1.5
-        elif behavior == "patrol":
-            success = self._execute_patrol(entity)
-            execution_time = 2.0
-        elif behavior == "wander":
-            success = self._execute_wander(entity)
-            execution_time = 1.2
-        elif behavior == "explore":
-            success = self._execute_explore(entity)
-            execution_time = 2.5
-        elif behavior == "seek_social":
-            success = self._execute_seek_social(entity)
-            execution_time = 1.8
-            
-        # Update statistics
+        handler, execution_time = self._exec_dispatch.get(behavior, (None, 0.0))
+        success = handler(entity) if handler is not None else True
+        
         if success:
-            self.stats.successful_interactions += 1
-            entity.state.last_action = behavior
+            entity.state.last_action = _BEHAVIOR_NAMES.get(behavior, behavior)
             entity.state.action_cooldown = execution_time
-        else:
-            self.stats.failed_interactions += 1
+        return success
+            
+    def _record_outcome(self, success: bool):
+        """Track a behavior outcome in the recent success window"""
+        outcomes = self._recent_outcomes
+        if len(outcomes) == outcomes.maxlen and outcomes[0]:
+            self._recent_successes -= 1
+        outcomes.append(success)
+        if success:
+            self._recent_successes += 1
             
     def _execute_attack(self, entity: Entity) -> bool:
         """Execute attack behavior"""
         # Simulate attack action
-        time.sleep(0.01)  # Simulate processing time
         entity.state.energy = max(0, entity.state.energy - 5.0)
         return True
         
     def _execute_flee(self, entity: Entity) -> bool:
         """Execute flee behavior"""
         # Simulate fleeing action
-        time.sleep(0.005)  # Simulate processing time
         entity.state.energy = max(0, entity.state.energy - 2.0)
         return True
         
     def _execute_interaction(self, entity: Entity) -> bool:
         """Execute social interaction behavior"""
         # Simulate interaction
-        time.sleep(0.02)  # Simulate processing time
         entity.state.energy = max(0, entity.state.energy - 1.0)
         return True
         
     def _execute_patrol(self, entity: Entity) -> bool:
         """Execute patrol behavior"""
         # Simulate patrolling
-        time.sleep(0.01)  # Simulate processing time
         entity.state.energy = max(0, entity.state.energy - 1.5)
         return True
         
     def _execute_wander(self, entity: Entity) -> bool:
         """Execute wandering behavior"""
         # Simulate wandering
-        time.sleep(0.005)  # Simulate processing time
         entity.state.energy = max(0, entity.state.energy - 0.5)
         return True
         
     def _execute_explore(self, entity: Entity) -> bool:
         """Execute exploration behavior"""
         # Simulate exploration
-        time.sleep(0.015)  # Simulate processing time
         entity.state.energy = max(0, entity.state.energy - 2.0)
         return True
         
     def _execute_seek_social(self, entity: Entity) -> bool:
         """Execute social seeking behavior"""
         # Simulate seeking social interaction
-        time.sleep(0.01)  # Simulate processing time
         entity.state.energy = max(0, entity.state.energy - 1.0)
         return True
         
-    def _get_nearby_entities(self, entity: Entity) -> List[Entity]:
-        """Get entities within perception range"""
+    def _rebuild_spatial_index(self):
+        """Snapshot hot entity state into columns and bucket rows into a uniform grid"""
+        cell_size = max(self.settings.perception_range, 1e-6)
+        grid: Dict[Tuple[int, int, int], List[int]] = {}
+        rows: List[Entity] = []
+        row_of: Dict[str, int] = {}
+        pos_x: List[float] = []
+        pos_y: List[float] = []
+        pos_z: List[float] = []
+        faction_ids: List[int] = []
+        aggressive: List[bool] = []
+        intern_faction = self._intern_faction
+        
+        for entity in self.entities.values():
+            row = len(rows)
+            x, y, z = entity.state.position
+            rows.append(entity)
+            row_of[entity.id] = row
+            pos_x.append(x)
+            pos_y.append(y)
+            pos_z.append(z)
+            faction_ids.append(intern_faction(entity.faction))
+            aggressive.append(entity.behavior.aggression > 0.7)
+            
+            key = (int(x // cell_size), int(y // cell_size), int(z // cell_size))
+            bucket = grid.get(key)
+            if bucket is None:
+                grid[key] = [row]
+            else:
+                bucket.append(row)
+                
+        self._spatial_grid = grid
+        self._spatial_cell_size = cell_size
+        self._rows = rows
+        self._row_of = row_of
+        self._pos_x = pos_x
+        self._pos_y = pos_y
+        self._pos_z = pos_z
+        self._faction_id = faction_ids
+        self._aggressive = aggressive
+        
+    def _intern_faction(self, faction: str) -> int:
+        """Map a faction name to a small int id, growing the hostility table"""
+        faction_id = self._faction_id_of.get(faction)
+        if faction_id is None:
+            faction_id = len(self._hostile)
+            # Factions are hostile to every faction but their own
+            for row in self._hostile:
+                row.append(True)
+            self._hostile.append([True] * faction_id + [False])
+            self._faction_id_of[faction] = faction_id
+        return faction_id
+        
+    def _get_nearby_rows(self, entity: Entity) -> List[int]:
+        """Get column rows of entities within perception range"""
+        if self._spatial_grid is None:
+            self._rebuild_spatial_index()
+            
+        grid = self._spatial_grid
+        cell_size = self._spatial_cell_size
+        range_sq = self._perception_r2
+        pos_x, pos_y, pos_z = self._pos_x, self._pos_y, self._pos_z
+        own_row = self._row_of.get(entity.id, -1)
+        x, y, z = entity.state.position
+        cx, cy, cz = int(x // cell_size), int(y // cell_size), int(z // cell_size)
+        
+        # Cell size equals perception range, so only the 27 surrounding cells can hold hits
         nearby = []
-        for other_id, other_entity in self.entities.items():
-            if other_id != entity.id:
-                distance = math.sqrt(
-                    (entity.state.position[0] - other_entity.state.position[0]) ** 2 +
-                    (entity.state.position[1] - other_entity.state.position[1]) ** 2 +
-                    (entity.state.position[2] - other_entity.state.position[2]) ** 2
-                )
-                if distance <= self.settings.perception_range:
-                    nearby.append(other_entity)
+        for ix in (cx - 1, cx, cx + 1):
+            for iy in (cy - 1, cy, cy + 1):
+                for iz in (cz - 1, cz, cz + 1):
+                    bucket = grid.get((ix, iy, iz))
+                    if bucket:
+                        _collect_rows_in_range(
+                            bucket, pos_x, pos_y, pos_z, x, y, z, range_sq, own_row, nearby
+                        )
         return nearby
         
+    def _get_nearby_entities(self, entity: Entity) -> List[Entity]:
+        """Get entities within perception range"""
+        rows = self._rows
+        return [rows[r] for r in self._get_nearby_rows(entity)]
+        
     def _is_threat(self, entity: Entity, other: Entity) -> bool:
         """Check if another entity is a threat"""
         # Simple threat assessment
@@ -345,11 +657,8 @@ class AIBehaviorSystem(EngineSystem):
         # This is where the self-improvement happens
         self.stats.learning_cycles += 1
         
-        # Adjust behavior preferences based on success rate
-        success_rate = (
-            self.stats.successful_interactions /
-            max(1, self.stats.successful_interactions + self.stats.failed_interactions)
-        )
+        # Adjust behavior preferences based on the recent success rate
+        success_rate = self._recent_successes / max(1, len(self._recent_outcomes))
         
         # If success rate is low, increase exploration of new behaviors
         if success_rate < 0.7:
@@ -357,6 +666,10 @@ class AIBehaviorSystem(EngineSystem):
         elif success_rate > 0.9:
             self.settings.learning_rate = max(0.001, self.settings.learning_rate - 0.0005)
             
+        if (self.settings.persist_learned_state
+                and self.stats.learning_cycles % self.settings.learned_state_save_interval == 0):
+            self._save_learned_state()
+            
     def _update_relationships(self, entity: Entity):
         """Update relationships with other entities"""
         # Simple relationship update based on recent interactions
@@ -365,38 +678,95 @@ class AIBehaviorSystem(EngineSystem):
     def _update_memory(self, entity: Entity):
         """Update entity memory with recent experiences"""
         # Store successful actions in memory
-        if entity.state.last_action not in entity.behavior.memory:
-            entity.behavior.memory[entity.state.last_action] = 0
-        entity.behavior.memory[entity.state.last_action] += 1
+        memory = entity.behavior.memory
+        action = entity.state.last_action
+        memory[action] = memory.get(action, 0) + 1
         
     def add_entity(self, entity_id: str, entity: Entity):
         """Add an entity to the behavior system"""
-        self.entities[entity_id] = entity
-        print(f"Added entity '{entity_id}' to AI behavior system")
+        self._run_or_defer(self._add_entity_now, entity_id, entity)
         
     def remove_entity(self, entity_id: str):
         """Remove an entity from the behavior system"""
+        self._run_or_defer(self._remove_entity_now, entity_id)
+        
+    def set_behavior_type(self, entity_id: str, behavior_type: BehaviorType):
+        """Set behavior type for an entity"""
+        self._run_or_defer(self._set_behavior_type_now, entity_id, behavior_type)
+        
+    def _run_or_defer(self, op: Callable, *args):
+        """Apply an entity mutation now, or queue it if a tick is iterating entities"""
+        with self._entities_lock:
+            if self._in_tick:
+                self._pending_ops.append((op, args))
+            else:
+                op(*args)
+                
+    def _flush_pending_ops(self):
+        """Apply entity mutations queued during the previous tick"""
+        with self._entities_lock:
+            pending, self._pending_ops = self._pending_ops, []
+            for op, args in pending:
+                op(*args)
+                
+    def _add_entity_now(self, entity_id: str, entity: Entity):
+        """Add an entity immediately"""
+        entity.faction = sys.intern(entity.faction)
+        entity.state.last_action = sys.intern(entity.state.last_action)
+        self.entities[entity_id] = entity
+        self._spatial_grid = None
+        self._dirty.add(entity_id)
+        self._wake_at.pop(entity_id, None)
+        self._last_visit[entity_id] = self._sim_time
+        _LOG.debug("Added entity '%s' to AI behavior system", entity_id)
+        
+    def _remove_entity_now(self, entity_id: str):
+        """Remove an entity immediately"""
         if entity_id in self.entities:
             del self.entities[entity_id]
-            print(f"Removed entity '{entity_id}' from AI behavior system")
+            self._spatial_grid = None
+            self._dirty.discard(entity_id)
+            self._wake_at.pop(entity_id, None)
+            self._last_visit.pop(entity_id, None)
+            _LOG.debug("Removed entity '%s' from AI behavior system", entity_id)
             
-    def set_behavior_type(self, entity_id: str, behavior_type: BehaviorType):
-        """Set behavior type for an entity"""
+    def _set_behavior_type_now(self, entity_id: str, behavior_type: BehaviorType):
+        """Set behavior type for an entity immediately"""
         if entity_id in self.entities:
             self.entities[entity_id].behavior.behavior_type = behavior_type
-            print(f"Set behavior type for '{entity_id}' to {behavior_type.name}")
+            self._dirty.add(entity_id)
+            _LOG.debug("Set behavior type for '%s' to %s", entity_id, behavior_type.name)
             
+    def set_perception_range(self, perception_range: float):
+        """Set how far entities can perceive"""
+        self._run_or_defer(self._set_perception_range_now, perception_range)
+        
+    def set_communication_range(self, communication_range: float):
+        """Set how far entities can communicate"""
+        self._run_or_defer(self._set_communication_range_now, communication_range)
+        
+    def _set_perception_range_now(self, perception_range: float):
+        """Set the perception range immediately"""
+        self.settings.perception_range = perception_range
+        self._refresh_ranges()
+        _LOG.debug("Perception range set to %s", perception_range)
+        
+    def _set_communication_range_now(self, communication_range: float):
+        """Set the communication range immediately"""
+        self.settings.communication_range = communication_range
+        self._refresh_ranges()
+        _LOG.debug("Communication range set to %s", communication_range)
+        
     def get_behavior_stats(self) -> BehaviorStats:
         """Get current behavior statistics"""
         return self.stats.copy() if hasattr(self.stats, 'copy') else self.stats
         
     def get_performance_rating(self) -> float:
         """Get AI behavior performance rating (0.0 to 1.0)"""
-        if not self.response_times:
+        if not self._recent_response_times:
             return 1.0
             
-        recent_responses = self.response_times[-30:]
-        avg_response_time = sum(recent_responses) / len(recent_responses)
+        avg_response_time = self._recent_response_sum / len(self._recent_response_times)
         
         # Performance rating based on response time (target < 0.05s)
         rating = max(0.0, min(1.0, 1.0 - (avg_response_time / 0.05)))
@@ -404,6 +774,7 @@ class AIBehaviorSystem(EngineSystem):
 
 if __name__ == "__main__":
     # Example usage
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     ai_system = AIBehaviorSystem()
     ai_system.initialize()
     
@@ -4,14 +4,19 @@ Procedural content generation with self-improvement capabilities
 """
 
 import time
+import logging
 import random
 import math
-import hashlib
-from typing import Dict, List, Tuple, Any
-from dataclasses import dataclass, field
+from array import array
+from collections import OrderedDict, deque
+from functools import partial
+from typing import Dict, List, Tuple, Any, Sequence, Callable
+from dataclasses import dataclass
 from .engine_core import EngineSystem
 
-@dataclass
+_LOG = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class GenerationSettings:
     seed: int = 42
     quality_level: int = 3  # 1-5, where 5 is highest quality
@@ -19,8 +24,9 @@ class GenerationSettings:
     enable_adaptive_generation: bool = True
     max_generation_time: float = 5.0  # seconds
     cache_size: int = 100
+    terrain_block_size: int = 16  # Terrain samples per tile edge
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorldParameters:
     size: Tuple[int, int, int] = (1000, 100, 1000)  # width, height, depth
     terrain_complexity: float = 0.5
@@ -28,16 +34,16 @@ class WorldParameters:
     biome_count: int = 5
     cave_density: float = 0.2
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuestParameters:
     difficulty_range: Tuple[int, int] = (1, 10)
     reward_variance: float = 0.3
     narrative_complexity: float = 0.5
-    objective_types: List[str] = field(default_factory=lambda: [
+    objective_types: Tuple[str, ...] = (
         "retrieve", "defeat", "explore", "protect", "deliver"
-    ])
+    )
 
-@dataclass
+@dataclass(slots=True)
 class GenerationStats:
     worlds_generated: int = 0
     quests_generated: int = 0
@@ -46,6 +52,209 @@ class GenerationStats:
     cache_hits: int = 0
     cache_misses: int = 0
 
+# World units between terrain samples
+_TERRAIN_SPACING = 10
+
+# Terrain heights are stored as int16 multiples of this (10 cm)
+_HEIGHT_QUANTUM = 0.1
+_HEIGHT_LIMIT = 32767
+
+# Terrain material codes index this table
+_MATERIALS = ("sand", "grass")
+
+# String pools shared by the content kernels
+_BIOME_TYPES = ("forest", "desert", "plains", "mountains", "swamp")
+_WATER_TYPES = ("lake", "river", "pond")
+_POI_TYPES = ("tower", "ruins", "village", "dungeon", "cave_entrance", "landmark")
+_NPC_TYPES = ("merchant", "guard", "quest_giver", "enemy", "animal")
+
+_RELIC_ADJECTIVES = ("Ancient", "Cursed", "Blessed", "Lost")
+_RELICS = ("Artifact", "Crystal", "Relic", "Gem")
+_SITES = ("Cave", "Ruins", "Tower", "Dungeon")
+_ELEMENTS = ("Light", "Darkness", "Fire", "Water", "Earth", "Air")
+_FOE_ADJECTIVES = ("Ancient", "Cursed", "Powerful", "Mighty")
+_FOES = ("Dragon", "Demon", "Giant", "Beast")
+_EXPLORE_ADJECTIVES = ("Mysterious", "Hidden", "Forbidden", "Ancient")
+_EXPLORE_SITES = ("Cave", "Ruins", "Tower", "Dungeon", "Forest", "Mountain")
+_WARDS = ("Village", "Caravan", "Scholar", "Merchant")
+_THREATS = ("Bandits", "Monsters", "Demons", "Invaders")
+_PARCELS = ("Package", "Letter", "Gift", "Supplies")
+_RECIPIENTS = ("Merchant", "Scholar", "Guard Captain", "Village Elder")
+_DESTINATIONS = ("Market District", "Scholar's Tower", "Guard Barracks", "Village Center")
+_TASK_ADJECTIVES = ("Mysterious", "Challenging", "Important")
+_TASK_KINDS = ("simple", "complex", "urgent")
+_VIRTUES = ("skill", "courage", "wisdom")
+_REWARD_ADJECTIVES = ("Rare", "Magic", "Ancient")
+_REWARD_KINDS = ("Weapon", "Armor", "Potion", "Scroll")
+_TITLE_ADJECTIVES = ("Lost", "Cursed", "Blessed", "Ancient")
+_TITLE_NOUNS = ("Quest", "Journey", "Adventure", "Mission")
+_ERAS = ("A long time ago", "Recently", "In the near future", "In a distant land")
+_HEROES = ("a great hero", "a wise scholar", "a brave warrior", "an ordinary person")
+_DISCOVERY_VERBS = ("discovered", "encountered", "found", "learned of")
+_DISCOVERIES = ("a terrible secret", "an ancient mystery", "a powerful artifact", "a dangerous threat")
+_GIVER_ADJECTIVES = ("Old", "Wise", "Mysterious", "Ancient")
+_GIVERS = ("Wizard", "Knight", "Scholar", "Merchant")
+
+_ITEM_TYPES = ("weapon", "armor", "consumable", "quest_item")
+_RARITIES = ("common", "uncommon", "rare", "epic", "legendary")
+_WEAPON_TYPES = ("sword", "axe", "bow", "staff", "dagger")
+_WEAPON_ADJECTIVES = ("Sharp", "Heavy", "Swift", "Ancient", "Cursed")
+_ARMOR_TYPES = ("helmet", "chestplate", "leggings", "boots", "shield")
+_ARMOR_ADJECTIVES = ("Sturdy", "Reinforced", "Enchanted", "Ancient", "Cursed")
+_DAMAGE_ELEMENTS = ("Fire", "Ice", "Lightning", "Poison")
+_CONSUMABLE_TYPES = ("potion", "scroll", "food", "elixir")
+_CONSUMABLE_ADJECTIVES = ("Healing", "Mana", "Strength", "Speed", "Invisibility")
+_CONSUMABLE_FORMS = ("Potion", "Scroll", "Elixir")
+_CONSUMABLE_EFFECTS = ("heal", "mana_restore", "buff", "debuff_remove")
+_ARTIFACTS = ("Artifact", "Relic", "Crystal", "Gem")
+_ARTIFACT_ADJECTIVES = ("powerful", "mysterious", "ancient", "cursed")
+_ARTIFACT_ORIGINS = ("great importance", "unknown origin", "immense power", "historical significance")
+_MISC_TYPES = ("material", "tool", "junk", "misc")
+_MISC_ADJECTIVES = ("Common", "Simple", "Basic")
+_MISC_NOUNS = ("Material", "Tool", "Component")
+_MISC_QUALITIES = ("useful", "common", "simple")
+
+def _uniform_noise(x: float, y: float, rng: random.Random) -> float:
+    """Placeholder noise (in a real implementation, this would be more complex)"""
+    return rng.uniform(-1, 1)
+
+def _mountain_fractal(x: float, y: float) -> float:
+    return abs(math.sin(x * 0.1) * math.cos(y * 0.1))
+
+def _cave_fractal(x: float, y: float) -> float:
+    return math.sin(x * 0.05) * math.cos(y * 0.05)
+
+def _terrain_kernel(rows: Sequence[int], cols: Sequence[int], size_x: int, size_z: int,
+                    noise: Callable[[float, float], float], mountain: Callable[[float, float], float],
+                    complexity: float, water_level: float) -> Tuple[List[float], List[int]]:
+    """Compute heights and material codes for terrain grid cells in a single pass"""
+    grid_x = [i * _TERRAIN_SPACING for i in range(size_x)]
+    grid_z = [j * _TERRAIN_SPACING for j in range(size_z)]
+    amplitude = complexity * 50
+    water_height = water_level * 100
+    heights = []
+    materials = []
+    
+    if mountain is not _mountain_fractal:
+        # Registered replacement fractal: evaluate it per cell
+        for i, j in zip(rows, cols):
+            x, z = grid_x[i], grid_z[j]
+            h = noise(x, z) * amplitude + mountain(x, z) * 20
+            heights.append(h)
+            materials.append(h > water_height)  # 0 = sand, 1 = grass
+        return heights, materials
+        
+    # The built-in mountain term is separable, so evaluate sin/cos once per grid line
+    mountain_x = [math.sin(x * 0.1) * 20 for x in grid_x]
+    mountain_z = [math.cos(z * 0.1) for z in grid_z]
+    for i, j in zip(rows, cols):
+        h = noise(grid_x[i], grid_z[j]) * amplitude + abs(mountain_x[i] * mountain_z[j])
+        heights.append(h)
+        materials.append(h > water_height)  # 0 = sand, 1 = grass
+    return heights, materials
+
+def _randints(rng: random.Random, low: int, high: int, count: int) -> List[int]:
+    """Draw count integers in [low, high] with one batched call"""
+    return rng.choices(range(low, high + 1), k=count)
+
+def _tiled_grid_order(size_x: int, size_z: int, block: int) -> Tuple[List[int], List[int]]:
+    """Grid cells ordered tile by tile, row-major inside each tile"""
+    rows = []
+    cols = []
+    for tile_x in range(0, size_x, block):
+        end_x = min(tile_x + block, size_x)
+        for tile_z in range(0, size_z, block):
+            tile_cols = range(tile_z, min(tile_z + block, size_z))
+            for i in range(tile_x, end_x):
+                rows.extend([i] * len(tile_cols))
+                cols.extend(tile_cols)
+    return rows, cols
+
+def _random_flags(rng: random.Random, count: int) -> List[bool]:
+    """Draw count fair booleans from the bits of a single random integer"""
+    bits = rng.getrandbits(count) if count else 0
+    return [(bits >> i) & 1 == 1 for i in range(count)]
+
+def _category_codes(rng: random.Random, labels: Sequence[str], count: int) -> array:
+    """Draw count int8 indices into a label table"""
+    return array("b", _randints(rng, 0, len(labels) - 1, count))
+
+class ContentTable:
+    """Column-oriented table of generated content, one sequence per field"""
+    
+    def __init__(self, columns: Dict[str, Sequence], labels: Dict[str, Sequence[str]] = None,
+                 vectors: Dict[str, Tuple[str, ...]] = None):
+        self.columns = columns
+        self.labels = labels or {}  # Code columns -> label tables
+        self.vectors = vectors or {}  # Row fields rebuilt as tuples of component columns
+        
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> "ContentTable":
+        """Build a table from row dicts; fields missing from a row are stored as None"""
+        names = {}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+        return cls({name: [row.get(name) for row in rows] for name in names})
+        
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        return 0
+        
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Assemble a single row as a dict, skipping empty cells"""
+        row = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            if value is not None:
+                row[name] = value
+        for name, table in self.labels.items():
+            row[name] = table[row[name]]
+        for name, components in self.vectors.items():
+            row[name] = tuple(row.pop(component) for component in components)
+        return row
+        
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+class TerrainGrid(ContentTable):
+    """Terrain samples stored tile by tile so neighbouring cells stay close in memory"""
+    
+    def __init__(self, columns: Dict[str, Sequence], size_x: int, size_z: int,
+                 spacing: int, block: int):
+        super().__init__(columns, {"material": _MATERIALS}, {"position": ("x", "y", "z")})
+        self.size_x = size_x
+        self.size_z = size_z
+        self.spacing = spacing
+        self.block = block
+        
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        row = super().__getitem__(index)
+        x, y, z = row["position"]
+        row["position"] = (x, y * _HEIGHT_QUANTUM, z)
+        row["normal"] = (0, 1, 0)  # Simplified normal
+        return row
+        
+    def heights(self) -> List[float]:
+        """Dequantized sample heights in world units"""
+        return [h * _HEIGHT_QUANTUM for h in self.columns["y"]]
+        
+    def index_of(self, x: float, z: float) -> int:
+        """Row index of the sample covering world position (x, z)"""
+        i = int(x) // self.spacing
+        j = int(z) // self.spacing
+        if not (0 <= i < self.size_x and 0 <= j < self.size_z):
+            raise IndexError(f"position ({x}, {z}) is outside the terrain grid")
+            
+        block = self.block
+        tile_x, offset_x = divmod(i, block)
+        tile_z, offset_z = divmod(j, block)
+        tile_rows = min(block, self.size_x - tile_x * block)
+        tile_cols = min(block, self.size_z - tile_z * block)
+        return (tile_x * block * self.size_z + tile_z * block * tile_rows
+                + offset_x * tile_cols + offset_z)
+
 class ContentGenerator(EngineSystem):
     def __init__(self):
         self.settings = GenerationSettings()
@@ -53,13 +262,24 @@ class ContentGenerator(EngineSystem):
         self.quest_params = QuestParameters()
         self.stats = GenerationStats()
         
-        # Generation caches
-        self.world_cache = {}
-        self.quest_cache = {}
-        self.item_cache = {}
+        # Per-kind generation time totals behind stats.avg_generation_time
+        self._world_time_sum = 0.0
+        self._quest_time_sum = 0.0
+        self._item_time_sum = 0.0
+        
+        # Cache counters, copied into stats when they are read
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Generation caches (LRU order, oldest first)
+        self.world_cache = OrderedDict()
+        self.quest_cache = OrderedDict()
+        self.item_cache = OrderedDict()
         
         # Self-improvement components
-        self.generation_history = []
+        self.max_generation_history = 1024
+        self.generation_history = deque(maxlen=self.max_generation_history)
+        self._recent_generation_times = deque(maxlen=30)  # Window read by _adapt_generation
         self.performance_metrics = {}
         self.optimization_suggestions = []
         self.learning_rate = 0.01
@@ -69,73 +289,87 @@ class ContentGenerator(EngineSystem):
         self.fractal_functions = {}
         self.distribution_functions = {}
         
-        # Initialize random seed
-        random.seed(self.settings.seed)
+        # Objective type -> quest kernel
+        self._quest_kernels = {
+            "retrieve": self._generate_retrieve_quest,
+            "defeat": self._generate_defeat_quest,
+            "explore": self._generate_explore_quest,
+            "protect": self._generate_protect_quest,
+            "deliver": self._generate_deliver_quest
+        }
+        
+        # Seeded stream for drawing per-call seeds; each generation then
+        # uses its own random.Random(seed) so results depend only on the seed
+        self._rng = random.Random(self.settings.seed)
         
     def initialize(self):
         """Initialize the content generator"""
-        print("Initializing Content Generator...")
-        print(f"  Seed: {self.settings.seed}")
-        print(f"  Quality Level: {self.settings.quality_level}/5")
-        print(f"  Adaptive Generation: {'Enabled' if self.settings.enable_adaptive_generation else 'Disabled'}")
+        _LOG.info("Initializing Content Generator...")
+        _LOG.info("  Seed: %s", self.settings.seed)
+        _LOG.info("  Quality Level: %s/5", self.settings.quality_level)
+        _LOG.info("  Adaptive Generation: %s", 'Enabled' if self.settings.enable_adaptive_generation else 'Disabled')
         
         # Initialize generation algorithms
         self._initialize_algorithms()
         
-        print("Content Generator initialized successfully")
+        _LOG.info("Content Generator initialized successfully")
         
     def _initialize_algorithms(self):
         """Initialize procedural generation algorithms"""
         # Simple noise generator (in a real implementation, this would be more complex)
-        self.noise_generators["simplex"] = lambda x, y: random.uniform(-1, 1)
-        self.noise_generators["perlin"] = lambda x, y: random.uniform(-1, 1)
+        self.noise_generators["simplex"] = _uniform_noise
+        self.noise_generators["perlin"] = _uniform_noise
         
         # Fractal functions
-        self.fractal_functions["mountain"] = lambda x, y: abs(math.sin(x * 0.1) * math.cos(y * 0.1))
-        self.fractal_functions["cave"] = lambda x, y: math.sin(x * 0.05) * math.cos(y * 0.05)
+        self.fractal_functions["mountain"] = _mountain_fractal
+        self.fractal_functions["cave"] = _cave_fractal
         
         # Distribution functions
-        self.distribution_functions["uniform"] = lambda: random.uniform(0, 1)
-        self.distribution_functions["gaussian"] = lambda: random.gauss(0.5, 0.2)
+        self.distribution_functions["uniform"] = lambda: self._rng.uniform(0, 1)
+        self.distribution_functions["gaussian"] = lambda: self._rng.gauss(0.5, 0.2)
         
     def update(self, delta_time: float):
         """Update the content generator"""
-        # Clean up old cache entries if needed
-        self._manage_cache()
-        
         # Adapt generation parameters based on performance
         if self.settings.enable_adaptive_generation:
             self._adapt_generation()
             
-    def _manage_cache(self):
-        """Manage generation caches to prevent memory issues"""
-        caches = [self.world_cache, self.quest_cache, self.item_cache]
-        
-        for cache in caches:
-            if len(cache) > self.settings.cache_size:
-                # Remove oldest entries
-                keys_to_remove = list(cache.keys())[:10]
-                for key in keys_to_remove:
-                    del cache[key]
+    def _cache_lookup(self, cache: OrderedDict, key) -> Any:
+        """Return a cached result and mark it most recently used, or None"""
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+        return result
+        
+    def _cache_store(self, cache: OrderedDict, key, value):
+        """Cache a result, evicting the least recently used entries"""
+        cache[key] = value
+        while len(cache) > self.settings.cache_size:
+            cache.popitem(last=False)
                     
+    def _record_generation(self, entry: Dict[str, Any]):
+        """Append a generation to the bounded history"""
+        self.generation_history.append(entry)
+        self._recent_generation_times.append(entry["time"])
+        
     def _adapt_generation(self):
         """Adapt generation parameters based on performance"""
-        if len(self.generation_history) < 10:
+        recent_times = self._recent_generation_times
+        if len(recent_times) < 10:
             return
             
         # Calculate average generation time
-        recent_generations = self.generation_history[-30:]
-        avg_time = sum(g["time"] for g in recent_generations) / len(recent_generations)
+        avg_time = sum(recent_times) / len(recent_times)
         
         # Adjust complexity based on performance
         if avg_time > self.settings.max_generation_time * 0.8:
             # Reduce complexity
             self.settings.complexity_factor = max(0.1, self.settings.complexity_factor - 0.05)
-            print(f"Reducing generation complexity to {self.settings.complexity_factor:.2f}")
+            _LOG.debug("Reducing generation complexity to %.2f", self.settings.complexity_factor)
         elif avg_time < self.settings.max_generation_time * 0.5:
             # Increase complexity
             self.settings.complexity_factor = min(2.0, self.settings.complexity_factor + 0.02)
-            print(f"Increasing generation complexity to {self.settings.complexity_factor:.2f}")
+            _LOG.debug("Increasing generation complexity to %.2f", self.settings.complexity_factor)
             
     def generate_world(self, seed: int = None, params: WorldParameters = None) -> Dict[str, Any]:
         """Generate a procedural world"""
@@ -147,329 +381,321 @@ class ContentGenerator(EngineSystem):
             
         # Use provided seed or generate one
         if seed is None:
-            seed = random.randint(0, 1000000)
+            seed = self._rng.randint(0, 1000000)
             
         # Check cache first
-        cache_key = f"world_{seed}_{hash(str(params))}"
-        if cache_key in self.world_cache:
-            self.stats.cache_hits += 1
-            return self.world_cache[cache_key]
+        cache_key = (seed, params)
+        cached = self._cache_lookup(self.world_cache, cache_key)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
             
-        self.stats.cache_misses += 1
+        self._cache_misses += 1
         
         # Generate world
-        print(f"Generating world with seed {seed}...")
+        _LOG.debug("Generating world with seed %s...", seed)
+        rng = random.Random(seed)
         
         world = {
             "seed": seed,
-            "terrain": self._generate_terrain(params),
-            "biomes": self._generate_biomes(params),
-            "caves": self._generate_caves(params),
-            "water_bodies": self._generate_water_bodies(params),
-            "points_of_interest": self._generate_pois(params),
-            "npc_spawns": self._generate_npc_spawns(params)
+            "terrain": self._generate_terrain(params, rng),
+            "biomes": self._generate_biomes(params, rng),
+            "caves": self._generate_caves(params, rng),
+            "water_bodies": self._generate_water_bodies(params, rng),
+            "points_of_interest": self._generate_pois(params, rng),
+            "npc_spawns": self._generate_npc_spawns(params, rng)
         }
         
         # Cache the result
-        if len(self.world_cache) < self.settings.cache_size:
-            self.world_cache[cache_key] = world
+        self._cache_store(self.world_cache, cache_key, world)
             
         # Update statistics
         generation_time = time.time() - start_time
         self.stats.worlds_generated += 1
-        self.stats.avg_generation_time = (
-            (self.stats.avg_generation_time * (self.stats.worlds_generated - 1) + generation_time) 
-            / self.stats.worlds_generated
-        )
+        self._world_time_sum += generation_time
         
         # Store in history
-        self.generation_history.append({
+        self._record_generation({
             "type": "world",
             "time": generation_time,
             "seed": seed,
             "complexity": params.terrain_complexity
         })
         
-        print(f"World generation completed in {generation_time:.2f}s")
+        _LOG.debug("World generation completed in %.2fs", generation_time)
         return world
         
-    def _generate_terrain(self, params: WorldParameters) -> List[Dict]:
+    def _generate_terrain(self, params: WorldParameters, rng: random.Random) -> TerrainGrid:
         """Generate terrain data"""
-        terrain = []
         width, height, depth = params.size
         
-        # Simplified terrain generation
-        for x in range(0, width, 10):  # Reduced resolution for performance
-            for z in range(0, depth, 10):
-                # Generate height using noise
-                noise_value = self.noise_generators["simplex"](x, z)
-                base_height = noise_value * params.terrain_complexity * 50
-                
-                # Apply fractal functions for more interesting terrain
-                mountain_factor = self.fractal_functions["mountain"](x, z)
-                final_height = base_height + (mountain_factor * 20)
-                
-                terrain.append({
-                    "position": (x, final_height, z),
-                    "normal": (0, 1, 0),  # Simplified normal
-                    "material": "grass" if final_height > params.water_level * 100 else "sand"
-                })
-                
-        return terrain
-        
-    def _generate_biomes(self, params: WorldParameters) -> List[Dict]:
-        """Generate biome data"""
-        biomes = []
-        
-        for i in range(params.biome_count):
-            biome = {
-                "id": f"biome_{i}",
-                "type": random.choice(["forest", "desert", "plains", "mountains", "swamp"]),
-                "position": (
-                    random.randint(0, params.size[0]),
-                    0,
-                    random.randint(0, params.size[2])
-                ),
-                "radius": random.randint(50, 200),
-                "vegetation_density": random.uniform(0.1, 0.9),
-                "temperature": random.uniform(-10, 35)
-            }
-            biomes.append(biome)
+        # Simplified terrain generation at reduced resolution for performance
+        size_x = len(range(0, width, _TERRAIN_SPACING))
+        size_z = len(range(0, depth, _TERRAIN_SPACING))
+        block = max(1, self.settings.terrain_block_size)
+        rows, cols = _tiled_grid_order(size_x, size_z, block)
+        xs = [i * _TERRAIN_SPACING for i in rows]
+        zs = [j * _TERRAIN_SPACING for j in cols]
+        
+        # Noise generators take (x, y); the built-in placeholder also needs this
+        # world's random stream so terrain depends only on the seed
+        noise = self.noise_generators["simplex"]
+        if noise is _uniform_noise:
+            noise = partial(_uniform_noise, rng=rng)
             
-        return biomes
+        # Height from noise, plus mountain fractal for more interesting terrain
+        heights, materials = _terrain_kernel(rows, cols, size_x, size_z, noise,
+                                             self.fractal_functions["mountain"],
+                                             params.terrain_complexity, params.water_level)
         
-    def _generate_caves(self, params: WorldParameters) -> List[Dict]:
-        """Generate cave systems"""
-        caves = []
-        
-        cave_count = int(params.size[0] * params.size[2] * params.cave_density / 10000)
-        
-        for i in range(cave_count):
-            cave = {
-                "id": f"cave_{i}",
-                "entrance": (
-                    random.randint(0, params.size[0]),
-                    random.randint(0, int(params.size[1] * 0.3)),
-                    random.randint(0, params.size[2])
-                ),
-                "length": random.randint(20, 100),
-                "complexity": random.uniform(0.1, 1.0),
-                "treasure_chance": random.uniform(0.1, 0.5)
-            }
-            caves.append(cave)
-            
-        return caves
+        # Quantize heights to int16 and coordinates to the narrowest unsigned type
+        limit = _HEIGHT_LIMIT
+        quantized = array("h", [max(-limit, min(limit, round(h / _HEIGHT_QUANTUM))) for h in heights])
+        coord_type = "H" if max(width, depth) <= 0xFFFF else "L"
         
-    def _generate_water_bodies(self, params: WorldParameters) -> List[Dict]:
-        """Generate water bodies"""
-        water_bodies = []
+        return TerrainGrid({"x": array(coord_type, xs), "y": quantized,
+                            "z": array(coord_type, zs), "material": array("b", materials)},
+                           size_x, size_z, _TERRAIN_SPACING, block)
         
+    def _generate_biomes(self, params: WorldParameters, rng: random.Random) -> ContentTable:
+        """Generate biome data"""
+        count = params.biome_count
+        
+        return ContentTable({
+            "id": [f"biome_{i}" for i in range(count)],
+            "type": _category_codes(rng, _BIOME_TYPES, count),
+            "x": _randints(rng, 0, params.size[0], count),
+            "y": [0] * count,
+            "z": _randints(rng, 0, params.size[2], count),
+            "radius": _randints(rng, 50, 200, count),
+            "vegetation_density": [rng.uniform(0.1, 0.9) for _ in range(count)],
+            "temperature": [rng.uniform(-10, 35) for _ in range(count)]
+        }, {"type": _BIOME_TYPES}, {"position": ("x", "y", "z")})
+        
+    def _generate_caves(self, params: WorldParameters, rng: random.Random) -> ContentTable:
+        """Generate cave systems"""
+        count = int(params.size[0] * params.size[2] * params.cave_density / 10000)
+        
+        return ContentTable({
+            "id": [f"cave_{i}" for i in range(count)],
+            "x": _randints(rng, 0, params.size[0], count),
+            "y": _randints(rng, 0, int(params.size[1] * 0.3), count),
+            "z": _randints(rng, 0, params.size[2], count),
+            "length": _randints(rng, 20, 100, count),
+            "complexity": [rng.uniform(0.1, 1.0) for _ in range(count)],
+            "treasure_chance": [rng.uniform(0.1, 0.5) for _ in range(count)]
+        }, vectors={"entrance": ("x", "y", "z")})
+        
+    def _generate_water_bodies(self, params: WorldParameters, rng: random.Random) -> ContentTable:
+        """Generate water bodies"""
         # Generate a few lakes and rivers
-        for i in range(random.randint(3, 8)):
-            water_body = {
-                "id": f"water_{i}",
-                "type": random.choice(["lake", "river", "pond"]),
-                "position": (
-                    random.randint(0, params.size[0]),
-                    params.water_level * params.size[1],
-                    random.randint(0, params.size[2])
-                ),
-                "size": (
-                    random.randint(10, 100),
-                    5,
-                    random.randint(10, 100)
-                ),
-                "freshwater": random.choice([True, False])
-            }
-            water_bodies.append(water_body)
-            
-        return water_bodies
-        
-    def _generate_pois(self, params: WorldParameters) -> List[Dict]:
+        count = rng.randint(3, 8)
+        
+        return ContentTable({
+            "id": [f"water_{i}" for i in range(count)],
+            "type": _category_codes(rng, _WATER_TYPES, count),
+            "x": _randints(rng, 0, params.size[0], count),
+            "y": [params.water_level * params.size[1]] * count,
+            "z": _randints(rng, 0, params.size[2], count),
+            "size_x": _randints(rng, 10, 100, count),
+            "size_y": [5] * count,
+            "size_z": _randints(rng, 10, 100, count),
+            "freshwater": _random_flags(rng, count)
+        }, {"type": _WATER_TYPES},
+           {"position": ("x", "y", "z"), "size": ("size_x", "size_y", "size_z")})
+        
+    def _generate_pois(self, params: WorldParameters, rng: random.Random) -> ContentTable:
         """Generate points of interest"""
-        pois = []
-        
-        poi_types = ["tower", "ruins", "village", "dungeon", "cave_entrance", "landmark"]
-        
-        for i in range(random.randint(10, 30)):
-            poi = {
-                "id": f"poi_{i}",
-                "type": random.choice(poi_types),
-                "position": (
-                    random.randint(0, params.size[0]),
-                    random.randint(0, params.size[1]),
-                    random.randint(0, params.size[2])
-                ),
-                "difficulty": random.randint(1, 10),
-                "quest_marker": random.choice([True, False])
-            }
-            pois.append(poi)
-            
-        return pois
-        
-    def _generate_npc_spawns(self, params: WorldParameters) -> List[Dict]:
+        count = rng.randint(10, 30)
+        
+        return ContentTable({
+            "id": [f"poi_{i}" for i in range(count)],
+            "type": _category_codes(rng, _POI_TYPES, count),
+            "x": _randints(rng, 0, params.size[0], count),
+            "y": _randints(rng, 0, params.size[1], count),
+            "z": _randints(rng, 0, params.size[2], count),
+            "difficulty": _randints(rng, 1, 10, count),
+            "quest_marker": _random_flags(rng, count)
+        }, {"type": _POI_TYPES}, {"position": ("x", "y", "z")})
+        
+    def _generate_npc_spawns(self, params: WorldParameters, rng: random.Random) -> ContentTable:
         """Generate NPC spawn points"""
-        spawns = []
-        
-        npc_types = ["merchant", "guard", "quest_giver", "enemy", "animal"]
-        
-        for i in range(random.randint(20, 100)):
-            spawn = {
-                "id": f"spawn_{i}",
-                "type": random.choice(npc_types),
-                "position": (
-                    random.randint(0, params.size[0]),
-                    random.randint(0, params.size[1]),
-                    random.randint(0, params.size[2])
-                ),
-                "respawn_time": random.randint(30, 300),  # seconds
-                "aggro_radius": random.randint(10, 50) if "enemy" in npc_types else 0
-            }
-            spawns.append(spawn)
-            
-        return spawns
+        count = rng.randint(20, 100)
+        types = _category_codes(rng, _NPC_TYPES, count)
+        enemy = _NPC_TYPES.index("enemy")
+        
+        return ContentTable({
+            "id": [f"spawn_{i}" for i in range(count)],
+            "type": types,
+            "x": _randints(rng, 0, params.size[0], count),
+            "y": _randints(rng, 0, params.size[1], count),
+            "z": _randints(rng, 0, params.size[2], count),
+            "respawn_time": _randints(rng, 30, 300, count),  # seconds
+            "aggro_radius": [radius if npc_type == enemy else 0
+                             for npc_type, radius in zip(types, _randints(rng, 10, 50, count))]
+        }, {"type": _NPC_TYPES}, {"position": ("x", "y", "z")})
         
     def generate_quest(self, seed: int = None, params: QuestParameters = None) -> Dict[str, Any]:
         """Generate a procedural quest"""
+        return self._generate_quest_rows(1, None if seed is None else [seed], params)[0]
+        
+    def generate_quests(self, count: int, seeds: List[int] = None,
+                        params: QuestParameters = None) -> ContentTable:
+        """Generate a batch of procedural quests as a column table"""
+        return ContentTable.from_rows(self._generate_quest_rows(count, seeds, params))
+        
+    def _generate_quest_rows(self, count: int, seeds: List[int] = None,
+                             params: QuestParameters = None) -> List[Dict[str, Any]]:
+        """Generate quests in one pass, grouping the misses by objective type"""
         start_time = time.time()
         
         # Use provided parameters or defaults
         if params is None:
             params = self.quest_params
             
-        # Use provided seed or generate one
-        if seed is None:
-            seed = random.randint(0, 1000000)
+        # Use provided seeds or generate them
+        if seeds is None:
+            seeds = _randints(self._rng, 0, 1000000, count)
+        elif len(seeds) != count:
+            raise ValueError(f"got {len(seeds)} seeds for {count} quests")
             
         # Check cache first
-        cache_key = f"quest_{seed}_{hash(str(params))}"
-        if cache_key in self.quest_cache:
-            self.stats.cache_hits += 1
-            return self.quest_cache[cache_key]
-            
-        self.stats.cache_misses += 1
-        
-        # Generate quest
-        print(f"Generating quest with seed {seed}...")
-        
-        # Select objective type
-        objective_type = random.choice(params.objective_types)
-        
-        # Generate quest based on objective type
-        if objective_type == "retrieve":
-            quest = self._generate_retrieve_quest(params)
-        elif objective_type == "defeat":
-            quest = self._generate_defeat_quest(params)
-        elif objective_type == "explore":
-            quest = self._generate_explore_quest(params)
-        elif objective_type == "protect":
-            quest = self._generate_protect_quest(params)
-        elif objective_type == "deliver":
-            quest = self._generate_deliver_quest(params)
-        else:
-            quest = self._generate_generic_quest(params)
+        quests = [None] * count
+        missing = []
+        for index, seed in enumerate(seeds):
+            cached = self._cache_lookup(self.quest_cache, (seed, params))
+            if cached is not None:
+                self._cache_hits += 1
+                quests[index] = cached
+            else:
+                self._cache_misses += 1
+                missing.append(index)
+                
+        if not missing:
+            return quests
             
-        # Add common quest elements
-        quest.update({
-            "seed": seed,
-            "difficulty": random.randint(*params.difficulty_range),
-            "rewards": self._generate_rewards(params),
-            "narrative": self._generate_narrative(params)
-        })
-        
-        # Cache the result
-        if len(self.quest_cache) < self.settings.cache_size:
-            self.quest_cache[cache_key] = quest
+        # Generate quests
+        _LOG.debug("Generating %d quest(s)...", len(missing))
+        
+        # Give each quest its own stream, select objective types, then fan out per type
+        rngs = {}
+        by_type: Dict[str, List[int]] = {}
+        for index in missing:
+            rng = rngs[index] = random.Random(seeds[index])
+            by_type.setdefault(rng.choice(params.objective_types), []).append(index)
             
+        for objective_type, indices in by_type.items():
+            kernel = self._quest_kernels.get(objective_type, self._generate_generic_quest)
+            for index in indices:
+                rng = rngs[index]
+                quest = kernel(params, rng)
+                
+                # Add common quest elements
+                quest.update({
+                    "seed": seeds[index],
+                    "difficulty": rng.randint(*params.difficulty_range),
+                    "rewards": self._generate_rewards(params, rng),
+                    "narrative": self._generate_narrative(params, rng)
+                })
+                quests[index] = quest
+                
+                # Cache the result
+                self._cache_store(self.quest_cache, (seeds[index], params), quest)
+                
         # Update statistics
         generation_time = time.time() - start_time
-        self.stats.quests_generated += 1
-        self.stats.avg_generation_time = (
-            (self.stats.avg_generation_time * (self.stats.quests_generated - 1) + generation_time) 
-            / self.stats.quests_generated
-        )
+        self.stats.quests_generated += len(missing)
+        self._quest_time_sum += generation_time
         
         # Store in history
-        self.generation_history.append({
+        self._record_generation({
             "type": "quest",
             "time": generation_time,
-            "seed": seed,
-            "difficulty": quest["difficulty"]
+            "count": len(missing),
+            "seed": seeds[missing[0]],
+            "difficulty": quests[missing[0]]["difficulty"]
         })
         
-        print(f"Quest generation completed in {generation_time:.2f}s")
-        return quest
+        _LOG.debug("Quest generation completed in %.2fs", generation_time)
+        return quests
         
-    def _generate_retrieve_quest(self, params: QuestParameters) -> Dict:
+    def _generate_retrieve_quest(self, params: QuestParameters, rng: random.Random) -> Dict:
         """Generate a retrieve quest"""
+        target_item = f"{rng.choice(_RELIC_ADJECTIVES)} {rng.choice(_RELICS)}"
         return {
             "type": "retrieve",
-            "objective": f"Retrieve the {random.choice(['Ancient', 'Cursed', 'Blessed', 'Lost'])} {random.choice(['Artifact', 'Crystal', 'Relic', 'Gem'])}",
-            "target_item": f"{random.choice(['Ancient', 'Cursed', 'Blessed', 'Lost'])} {random.choice(['Artifact', 'Crystal', 'Relic', 'Gem'])}",
-            "location": f"{random.choice(['Cave', 'Ruins', 'Tower', 'Dungeon'])} of {random.choice(['Light', 'Darkness', 'Fire', 'Water', 'Earth', 'Air'])}",
-            "required_quantity": random.randint(1, 5)
+            "objective": f"Retrieve the {target_item}",
+            "target_item": target_item,
+            "location": f"{rng.choice(_SITES)} of {rng.choice(_ELEMENTS)}",
+            "required_quantity": rng.randint(1, 5)
         }
         
-    def _generate_defeat_quest(self, params: QuestParameters) -> Dict:
+    def _generate_defeat_quest(self, params: QuestParameters, rng: random.Random) -> Dict:
         """Generate a defeat quest"""
+        target_enemy = f"{rng.choice(_FOE_ADJECTIVES)} {rng.choice(_FOES)}"
         return {
             "type": "defeat",
-            "objective": f"Defeat the {random.choice(['Ancient', 'Cursed', 'Powerful', 'Mighty'])} {random.choice(['Dragon', 'Demon', 'Giant', 'Beast'])}",
-            "target_enemy": f"{random.choice(['Ancient', 'Cursed', 'Powerful', 'Mighty'])} {random.choice(['Dragon', 'Demon', 'Giant', 'Beast'])}",
-            "location": f"{random.choice(['Cave', 'Ruins', 'Tower', 'Dungeon'])} of {random.choice(['Light', 'Darkness', 'Fire', 'Water', 'Earth', 'Air'])}",
-            "required_kills": random.randint(1, 3)
+            "objective": f"Defeat the {target_enemy}",
+            "target_enemy": target_enemy,
+            "location": f"{rng.choice(_SITES)} of {rng.choice(_ELEMENTS)}",
+            "required_kills": rng.randint(1, 3)
         }
         
-    def _generate_explore_quest(self, params: QuestParameters) -> Dict:
+    def _generate_explore_quest(self, params: QuestParameters, rng: random.Random) -> Dict:
         """Generate an explore quest"""
+        location = f"{rng.choice(_EXPLORE_ADJECTIVES)} {rng.choice(_EXPLORE_SITES)}"
         return {
             "type": "explore",
-            "objective": f"Explore the {random.choice(['Mysterious', 'Hidden', 'Forbidden', 'Ancient'])} {random.choice(['Cave', 'Ruins', 'Tower', 'Dungeon', 'Forest', 'Mountain'])}",
-            "location": f"{random.choice(['Mysterious', 'Hidden', 'Forbidden', 'Ancient'])} {random.choice(['Cave', 'Ruins', 'Tower', 'Dungeon', 'Forest', 'Mountain'])}",
-            "exploration_goals": random.randint(3, 8)
+            "objective": f"Explore the {location}",
+            "location": location,
+            "exploration_goals": rng.randint(3, 8)
         }
         
-    def _generate_protect_quest(self, params: QuestParameters) -> Dict:
+    def _generate_protect_quest(self, params: QuestParameters, rng: random.Random) -> Dict:
         """Generate a protect quest"""
+        target = rng.choice(_WARDS)
+        threat = rng.choice(_THREATS)
         return {
             "type": "protect",
-            "objective": f"Protect the {random.choice(['Village', 'Caravan', 'Scholar', 'Merchant'])} from {random.choice(['Bandits', 'Monsters', 'Demons', 'Invaders'])}",
-            "target_to_protect": f"{random.choice(['Village', 'Caravan', 'Scholar', 'Merchant'])}",
-            "threat": f"{random.choice(['Bandits', 'Monsters', 'Demons', 'Invaders'])}",
-            "duration": f"{random.randint(5, 30)} minutes"
+            "objective": f"Protect the {target} from {threat}",
+            "target_to_protect": target,
+            "threat": threat,
+            "duration": f"{rng.randint(5, 30)} minutes"
         }
         
-    def _generate_deliver_quest(self, params: QuestParameters) -> Dict:
+    def _generate_deliver_quest(self, params: QuestParameters, rng: random.Random) -> Dict:
         """Generate a deliver quest"""
+        item = rng.choice(_PARCELS)
+        recipient = rng.choice(_RECIPIENTS)
         return {
             "type": "deliver",
-            "objective": f"Deliver {random.choice(['Package', 'Letter', 'Gift', 'Supplies'])} to {random.choice(['Merchant', 'Scholar', 'Guard Captain', 'Village Elder'])}",
-            "item": f"{random.choice(['Package', 'Letter', 'Gift', 'Supplies'])}",
-            "recipient": f"{random.choice(['Merchant', 'Scholar', 'Guard Captain', 'Village Elder'])}",
-            "destination": f"{random.choice(['Market District', 'Scholar\'s Tower', 'Guard Barracks', 'Village Center'])}"
+            "objective": f"Deliver {item} to {recipient}",
+            "item": item,
+            "recipient": recipient,
+            "destination": rng.choice(_DESTINATIONS)
         }
         
-    def _generate_generic_quest(self, params: QuestParameters) -> Dict:
+    def _generate_generic_quest(self, params: QuestParameters, rng: random.Random) -> Dict:
         """Generate a generic quest"""
         return {
             "type": "generic",
-            "objective": f"Complete the {random.choice(['Mysterious', 'Challenging', 'Important'])} task",
-            "description": f"A {random.choice(['simple', 'complex', 'urgent'])} task requiring {random.choice(['skill', 'courage', 'wisdom'])}"
+            "objective": f"Complete the {rng.choice(_TASK_ADJECTIVES)} task",
+            "description": f"A {rng.choice(_TASK_KINDS)} task requiring {rng.choice(_VIRTUES)}"
         }
         
-    def _generate_rewards(self, params: QuestParameters) -> Dict:
+    def _generate_rewards(self, params: QuestParameters, rng: random.Random) -> Dict:
         """Generate quest rewards"""
-        base_xp = random.randint(100, 1000)
-        base_gold = random.randint(10, 100)
+        base_xp = rng.randint(100, 1000)
+        base_gold = rng.randint(10, 100)
         
         # Apply variance
-        xp = int(base_xp * random.uniform(1 - params.reward_variance, 1 + params.reward_variance))
-        gold = int(base_gold * random.uniform(1 - params.reward_variance, 1 + params.reward_variance))
+        xp = int(base_xp * rng.uniform(1 - params.reward_variance, 1 + params.reward_variance))
+        gold = int(base_gold * rng.uniform(1 - params.reward_variance, 1 + params.reward_variance))
         
         # Chance for special rewards
         special_rewards = []
-        if random.random() < 0.3:  # 30% chance
-            special_rewards.append(f"{random.choice(['Rare', 'Magic', 'Ancient'])} {random.choice(['Weapon', 'Armor', 'Potion', 'Scroll'])}")
+        if rng.random() < 0.3:  # 30% chance
+            special_rewards.append(f"{rng.choice(_REWARD_ADJECTIVES)} {rng.choice(_REWARD_KINDS)}")
             
         return {
             "xp": xp,
@@ -477,12 +703,12 @@ class ContentGenerator(EngineSystem):
             "special_items": special_rewards
         }
         
-    def _generate_narrative(self, params: QuestParameters) -> Dict:
+    def _generate_narrative(self, params: QuestParameters, rng: random.Random) -> Dict:
         """Generate quest narrative"""
         return {
-            "title": f"The {random.choice(['Lost', 'Cursed', 'Blessed', 'Ancient'])} {random.choice(['Quest', 'Journey', 'Adventure', 'Mission'])}",
-            "description": f"{random.choice(['A long time ago', 'Recently', 'In the near future', 'In a distant land'])}, {random.choice(['a great hero', 'a wise scholar', 'a brave warrior', 'an ordinary person'])} {random.choice(['discovered', 'encountered', 'found', 'learned of'])} {random.choice(['a terrible secret', 'an ancient mystery', 'a powerful artifact', 'a dangerous threat'])}.",
-            "npc_giver": f"{random.choice(['Old', 'Wise', 'Mysterious', 'Ancient'])} {random.choice(['Wizard', 'Knight', 'Scholar', 'Merchant'])}"
+            "title": f"The {rng.choice(_TITLE_ADJECTIVES)} {rng.choice(_TITLE_NOUNS)}",
+            "description": f"{rng.choice(_ERAS)}, {rng.choice(_HEROES)} {rng.choice(_DISCOVERY_VERBS)} {rng.choice(_DISCOVERIES)}.",
+            "npc_giver": f"{rng.choice(_GIVER_ADJECTIVES)} {rng.choice(_GIVERS)}"
         }
         
     def generate_item(self, seed: int = None, item_type: str = None) -> Dict[str, Any]:
@@ -491,125 +717,132 @@ class ContentGenerator(EngineSystem):
         
         # Use provided seed or generate one
         if seed is None:
-            seed = random.randint(0, 1000000)
+            seed = self._rng.randint(0, 1000000)
             
         # Check cache first
-        cache_key = f"item_{seed}_{item_type or 'generic'}"
-        if cache_key in self.item_cache:
-            self.stats.cache_hits += 1
-            return self.item_cache[cache_key]
+        cache_key = (seed, item_type)
+        cached = self._cache_lookup(self.item_cache, cache_key)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
             
-        self.stats.cache_misses += 1
+        self._cache_misses += 1
         
         # Generate item
-        print(f"Generating item with seed {seed}...")
+        _LOG.debug("Generating item with seed %s...", seed)
+        rng = random.Random(seed)
         
         # Select item type if not provided
         if item_type is None:
-            item_type = random.choice(["weapon", "armor", "consumable", "quest_item"])
+            item_type = rng.choice(_ITEM_TYPES)
             
         # Generate item based on type
         if item_type == "weapon":
-            item = self._generate_weapon(seed)
+            item = self._generate_weapon(rng)
         elif item_type == "armor":
-            item = self._generate_armor(seed)
+            item = self._generate_armor(rng)
         elif item_type == "consumable":
-            item = self._generate_consumable(seed)
+            item = self._generate_consumable(rng)
         elif item_type == "quest_item":
-            item = self._generate_quest_item(seed)
+            item = self._generate_quest_item(rng)
         else:
-            item = self._generate_generic_item(seed)
+            item = self._generate_generic_item(rng)
             
         # Add common item elements
         item.update({
             "seed": seed,
-            "rarity": random.choice(["common", "uncommon", "rare", "epic", "legendary"]),
-            "value": random.randint(10, 1000)
+            "rarity": rng.choice(_RARITIES),
+            "value": rng.randint(10, 1000)
         })
         
         # Cache the result
-        if len(self.item_cache) < self.settings.cache_size:
-            self.item_cache[cache_key] = item
+        self._cache_store(self.item_cache, cache_key, item)
             
         # Update statistics
         generation_time = time.time() - start_time
         self.stats.items_generated += 1
-        self.stats.avg_generation_time = (
-            (self.stats.avg_generation_time * (self.stats.items_generated - 1) + generation_time) 
-            / self.stats.items_generated
-        )
+        self._item_time_sum += generation_time
         
         # Store in history
-        self.generation_history.append({
+        self._record_generation({
             "type": "item",
             "time": generation_time,
             "seed": seed,
             "rarity": item["rarity"]
         })
         
-        print(f"Item generation completed in {generation_time:.2f}s")
+        _LOG.debug("Item generation completed in %.2fs", generation_time)
         return item
         
-    def _generate_weapon(self, seed: int) -> Dict:
+    def _generate_weapon(self, rng: random.Random) -> Dict:
         """Generate a weapon"""
-        weapon_types = ["sword", "axe", "bow", "staff", "dagger"]
-        weapon_type = random.choice(weapon_types)
+        weapon_type = rng.choice(_WEAPON_TYPES)
         
         return {
             "type": "weapon",
             "subtype": weapon_type,
-            "name": f"{random.choice(['Sharp', 'Heavy', 'Swift', 'Ancient', 'Cursed'])} {weapon_type.capitalize()}",
-            "damage": random.randint(5, 50),
-            "speed": random.uniform(0.5, 2.0),
-            "special_effects": [f"{random.choice(['Fire', 'Ice', 'Lightning', 'Poison'])} Damage"] if random.random() < 0.3 else []
+            "name": f"{rng.choice(_WEAPON_ADJECTIVES)} {weapon_type.capitalize()}",
+            "damage": rng.randint(5, 50),
+            "speed": rng.uniform(0.5, 2.0),
+            "special_effects": [f"{rng.choice(_DAMAGE_ELEMENTS)} Damage"] if rng.random() < 0.3 else []
         }
         
-    def _generate_armor(self, seed: int) -> Dict:
+    def _generate_armor(self, rng: random.Random) -> Dict:
         """Generate armor"""
-        armor_types = ["helmet", "chestplate", "leggings", "boots", "shield"]
-        armor_type = random.choice(armor_types)
+        armor_type = rng.choice(_ARMOR_TYPES)
         
         return {
             "type": "armor",
             "subtype": armor_type,
-            "name": f"{random.choice(['Sturdy', 'Reinforced', 'Enchanted', 'Ancient', 'Cursed'])} {armor_type.capitalize()}",
-            "defense": random.randint(3, 30),
-            "durability": random.randint(50, 200),
-            "special_effects": [f"{random.choice(['Fire', 'Ice', 'Lightning', 'Poison'])} Resistance"] if random.random() < 0.3 else []
+            "name": f"{rng.choice(_ARMOR_ADJECTIVES)} {armor_type.capitalize()}",
+            "defense": rng.randint(3, 30),
+            "durability": rng.randint(50, 200),
+            "special_effects": [f"{rng.choice(_DAMAGE_ELEMENTS)} Resistance"] if rng.random() < 0.3 else []
         }
         
-    def _generate_consumable(self, seed: int) -> Dict:
+    def _generate_consumable(self, rng: random.Random) -> Dict:
         """Generate a consumable item"""
         return {
             "type": "consumable",
-            "subtype": random.choice(["potion", "scroll", "food", "elixir"]),
-            "name": f"{random.choice(['Healing', 'Mana', 'Strength', 'Speed', 'Invisibility'])} {random.choice(['Potion', 'Scroll', 'Elixir'])}",
-            "effect": random.choice(["heal", "mana_restore", "buff", "debuff_remove"]),
-            "potency": random.randint(1, 100),
-            "duration": f"{random.randint(10, 300)} seconds" if random.random() < 0.7 else "instant"
+            "subtype": rng.choice(_CONSUMABLE_TYPES),
+            "name": f"{rng.choice(_CONSUMABLE_ADJECTIVES)} {rng.choice(_CONSUMABLE_FORMS)}",
+            "effect": rng.choice(_CONSUMABLE_EFFECTS),
+            "potency": rng.randint(1, 100),
+            "duration": f"{rng.randint(10, 300)} seconds" if rng.random() < 0.7 else "instant"
         }
         
-    def _generate_quest_item(self, seed: int) -> Dict:
+    def _generate_quest_item(self, rng: random.Random) -> Dict:
         """Generate a quest item"""
         return {
             "type": "quest_item",
             "subtype": "artifact",
-            "name": f"{random.choice(['Ancient', 'Cursed', 'Blessed', 'Lost'])} {random.choice(['Artifact', 'Relic', 'Crystal', 'Gem'])}",
-            "description": f"A {random.choice(['powerful', 'mysterious', 'ancient', 'cursed'])} object of {random.choice(['great importance', 'unknown origin', 'immense power', 'historical significance'])}",
+            "name": f"{rng.choice(_RELIC_ADJECTIVES)} {rng.choice(_ARTIFACTS)}",
+            "description": f"A {rng.choice(_ARTIFACT_ADJECTIVES)} object of {rng.choice(_ARTIFACT_ORIGINS)}",
             "quest_required": True
         }
         
-    def _generate_generic_item(self, seed: int) -> Dict:
+    def _generate_generic_item(self, rng: random.Random) -> Dict:
         """Generate a generic item"""
         return {
             "type": "generic",
-            "subtype": random.choice(["material", "tool", "junk", "misc"]),
-            "name": f"{random.choice(['Common', 'Simple', 'Basic'])} {random.choice(['Material', 'Tool', 'Component'])}",
-            "description": f"A {random.choice(['useful', 'common', 'simple'])} item"
+            "subtype": rng.choice(_MISC_TYPES),
+            "name": f"{rng.choice(_MISC_ADJECTIVES)} {rng.choice(_MISC_NOUNS)}",
+            "description": f"A {rng.choice(_MISC_QUALITIES)} item"
         }
         
+    def _sync_stats(self):
+        """Fold lazily tracked counters and timings into stats"""
+        self.stats.cache_hits = self._cache_hits
+        self.stats.cache_misses = self._cache_misses
+        
+        total = self.stats.worlds_generated + self.stats.quests_generated + self.stats.items_generated
+        if total:
+            time_sum = self._world_time_sum + self._quest_time_sum + self._item_time_sum
+            self.stats.avg_generation_time = time_sum / total
+        
     def get_generation_stats(self) -> GenerationStats:
         """Get current generation statistics"""
+        self._sync_stats()
         return self.stats.copy() if hasattr(self.stats, 'copy') else self.stats
         
     def get_performance_rating(self) -> float:
@@ -618,6 +851,7 @@ class ContentGenerator(EngineSystem):
             return 1.0
             
         # Performance rating based on average generation time vs max allowed time
+        self._sync_stats()
         if self.stats.avg_generation_time <= 0:
             return 1.0
             
@@ -629,10 +863,11 @@ class ContentGenerator(EngineSystem):
         self.world_cache.clear()
         self.quest_cache.clear()
         self.item_cache.clear()
-        print("Content generation caches cleared")
+        _LOG.info("Content generation caches cleared")
 
 if __name__ == "__main__":
     # Example usage
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     generator = ContentGenerator()
     generator.initialize()
     
@@ -5,17 +5,23 @@ Main game loop and system management
 
 import time
 import threading
-from typing import Dict, List, Callable
+from collections import deque
+from time import perf_counter_ns, sleep
+from typing import Dict, List, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum
 
+# Frame limiter: sleep until this close to the deadline, then spin
+_SPIN_THRESHOLD_NS = 2_000_000
+_SLEEP_MARGIN_NS = 500_000
+
 class EngineState(Enum):
     STOPPED = 0
     RUNNING = 1
     PAUSED = 2
     ERROR = 3
 
-@dataclass
+@dataclass(slots=True)
 class SystemInfo:
     name: str
     version: str
@@ -27,16 +33,30 @@ class GameEngine:
         self.state = EngineState.STOPPED
         self.systems: Dict[str, object] = {}
         self.system_info: Dict[str, SystemInfo] = {}
-        self.frame_rate = 60
-        self.frame_time = 1.0 / self.frame_rate
+        
+        # Bound lifecycle methods, resolved once at registration
+        self._initialize_methods: Dict[str, Callable] = {}
+        self._update_methods: Dict[str, Callable] = {}
+        self.set_frame_rate(60)
         self.last_frame_time = 0
         self.current_frame = 0
-        self.performance_metrics = {}
+        self.max_performance_samples = 600
+        self.performance_metrics = deque(maxlen=self.max_performance_samples)  # (frame_number, frame_time_ns)
+        
+        # Running sums over the trailing stats window
+        self.stats_window = 300  # Frames (5 seconds at 60 FPS)
+        self._window_frames = deque(maxlen=self.stats_window)  # frame_time_ns
+        self._window_ns_sum = 0
+        self._window_fps_sum = 0.0
+        
+        self._state_changed = threading.Condition()  # Wakes the paused main loop
         
         # Self-improvement components
         self.improvement_modules = []
         self.learning_rate = 0.01
         self.adaptation_enabled = True
+        self.adapt_interval = 300  # Frames (5 seconds at 60 FPS)
+        self._adapt_countdown = self.adapt_interval
         
         print("Network God Game Engine initialized")
         
@@ -44,15 +64,27 @@ class GameEngine:
         """Register a system with the engine"""
         self.systems[name] = system
         self.system_info[name] = SystemInfo(name, version, "initialized", 1.0)
+        
+        # Record capabilities now so the frame loop never probes attributes
+        self._initialize_methods.pop(name, None)
+        self._update_methods.pop(name, None)
+        initialize = getattr(system, 'initialize', None)
+        if callable(initialize):
+            self._initialize_methods[name] = initialize
+        update = getattr(system, 'update', None)
+        if callable(update):
+            self._update_methods[name] = update
         print(f"System '{name}' registered with engine")
         
     def initialize_systems(self):
         """Initialize all registered systems"""
         print("Initializing engine systems...")
-        for name, system in self.systems.items():
+        initialize_methods = self._initialize_methods
+        for name in self.systems:
             try:
-                if hasattr(system, 'initialize'):
-                    system.initialize()
+                initialize = initialize_methods.get(name)
+                if initialize is not None:
+                    initialize()
                     self.system_info[name].status = "initialized"
                     print(f"  ✓ {name} initialized")
                 else:
@@ -71,6 +103,7 @@ class GameEngine:
         self.state = EngineState.RUNNING
         self.last_frame_time = time.time()
         self.current_frame = 0
+        self._adapt_countdown = self.adapt_interval
         
         # Start main loop in a separate thread
         self.engine_thread = threading.Thread(target=self._main_loop)
@@ -80,7 +113,9 @@ class GameEngine:
     def stop(self):
         """Stop the game engine"""
         print("Stopping Network God Game Engine...")
-        self.state = EngineState.STOPPED
+        with self._state_changed:
+            self.state = EngineState.STOPPED
+            self._state_changed.notify_all()
         
     def pause(self):
         """Pause the game engine"""
@@ -91,50 +126,87 @@ class GameEngine:
     def resume(self):
         """Resume the game engine"""
         if self.state == EngineState.PAUSED:
-            self.state = EngineState.RUNNING
+            with self._state_changed:
+                self.state = EngineState.RUNNING
+                self._state_changed.notify_all()
             self.last_frame_time = time.time()
             print("Engine resumed")
             
+    def set_frame_rate(self, frame_rate: int):
+        """Set the target frame rate and the derived frame budgets"""
+        self.frame_rate = frame_rate
+        self.frame_time = 1.0 / frame_rate
+        self._frame_ns = 1_000_000_000 // frame_rate
+        
     def _main_loop(self):
         """Main engine loop"""
+        next_deadline_ns = None
         while self.state != EngineState.STOPPED:
             if self.state == EngineState.RUNNING:
-                start_time = time.time()
+                start_ns = perf_counter_ns()
+                if next_deadline_ns is None:
+                    next_deadline_ns = start_ns
                 
                 # Update all systems
                 self._update_systems()
                 
-                # Self-improvement cycle
+                # Self-improvement cycle, counted down instead of taking a modulo
                 if self.adaptation_enabled:
-                    self._adapt_and_improve()
+                    self._adapt_countdown -= 1
+                    if not self._adapt_countdown:
+                        self._adapt_countdown = self.adapt_interval
+                        self._adapt_and_improve()
                 
                 # Calculate frame timing
-                end_time = time.time()
-                frame_duration = end_time - start_time
+                end_ns = perf_counter_ns()
+                frame_ns = end_ns - start_ns
                 self.current_frame += 1
                 
-                # Store performance metrics
-                self.performance_metrics[self.current_frame] = {
-                    "frame_time": frame_duration,
-                    "fps": 1.0 / frame_duration if frame_duration > 0 else 0,
-                    "frame_number": self.current_frame
-                }
+                # Store raw frame time; seconds and FPS are derived when read
+                self.performance_metrics.append((self.current_frame, frame_ns))
+                self._track_frame_window(frame_ns)
                 
-                # Maintain frame rate
-                sleep_time = self.frame_time - frame_duration
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                # Maintain frame rate on a fixed deadline schedule; when behind,
+                # skip the wait to catch up, but never by more than one frame
+                next_deadline_ns += self._frame_ns
+                if end_ns < next_deadline_ns:
+                    self._precise_wait(next_deadline_ns)
+                elif end_ns - next_deadline_ns > self._frame_ns:
+                    next_deadline_ns = end_ns
                     
             else:
-                time.sleep(0.01)  # Small sleep when paused
+                next_deadline_ns = None
+                # Block while paused; resume() and stop() wake us early
+                with self._state_changed:
+                    self._state_changed.wait_for(lambda: self.state != EngineState.PAUSED, timeout=0.05)
+                
+    def _precise_wait(self, deadline_ns: int):
+        """Wait until a perf_counter_ns deadline with sub-millisecond accuracy"""
+        # Coarse sleeps wake late, so stop short of the deadline
+        while True:
+            remaining = deadline_ns - perf_counter_ns()
+            if remaining <= _SPIN_THRESHOLD_NS:
+                break
+            sleep((remaining - _SLEEP_MARGIN_NS) * 1e-9)
+            
+        # Spin for the last stretch, yielding the GIL to other threads
+        while perf_counter_ns() < deadline_ns:
+            sleep(0)
                 
     def _update_systems(self):
         """Update all registered systems"""
-        for name, system in self.systems.items():
+        update_methods = self._update_methods
+        system_info = self.system_info
+        frame_time = self.frame_time
+        
+        # Each system's fair share of 90% of the frame budget scores 1.0
+        budget_ns = 0.9 * self._frame_ns / max(1, len(update_methods))
+        for name, update in update_methods.items():
             try:
-                if hasattr(system, 'update'):
-                    system.update(self.frame_time)
-                    self.system_info[name].performance = min(1.0, 1.0 / (self.frame_time * 0.9))
+                start_ns = perf_counter_ns()
+                update(frame_time)
+                elapsed_ns = perf_counter_ns() - start_ns
+                system_info[name].performance = min(1.0, budget_ns / max(1, elapsed_ns))
             except Exception as e:
                 self.system_info[name].status = "error"
                 print(f"Error updating {name}: {e}")
@@ -142,10 +214,9 @@ class GameEngine:
     def _adapt_and_improve(self):
         """Run self-improvement algorithms"""
         # This is where the engine would adapt based on performance metrics
-        # and player feedback
-        if self.current_frame % 300 == 0:  # Every 5 seconds at 60 FPS
-            self._analyze_performance()
-            self._optimize_systems()
+        # and player feedback; _main_loop calls this every adapt_interval frames
+        self._analyze_performance()
+        self._optimize_systems()
             
     def _analyze_performance(self):
         """Analyze engine performance and identify bottlenecks"""
@@ -153,9 +224,7 @@ class GameEngine:
             return
             
         # Calculate average frame time
-        recent_frames = list(self.performance_metrics.values())[-300:]  # Last 5 seconds
-        avg_frame_time = sum(f["frame_time"] for f in recent_frames) / len(recent_frames)
-        avg_fps = sum(f["fps"] for f in recent_frames) / len(recent_frames)
+        avg_frame_time, avg_fps = self._frame_averages()  # Last 5 seconds
         
         # Identify systems with poor performance
         slow_systems = []
@@ -168,6 +237,24 @@ class GameEngine:
             if slow_systems:
                 print(f"Slow systems: {', '.join([f'{name} ({perf:.2f})' for name, perf in slow_systems])}")
                 
+    def _track_frame_window(self, frame_ns: int):
+        """Slide the stats window forward by one frame"""
+        window = self._window_frames
+        if len(window) == window.maxlen:
+            oldest = window[0]
+            self._window_ns_sum -= oldest
+            if oldest > 0:
+                self._window_fps_sum -= 1e9 / oldest
+        window.append(frame_ns)
+        self._window_ns_sum += frame_ns
+        if frame_ns > 0:
+            self._window_fps_sum += 1e9 / frame_ns
+            
+    def _frame_averages(self) -> Tuple[float, float]:
+        """Average frame time (seconds) and FPS over the stats window"""
+        count = len(self._window_frames)
+        return self._window_ns_sum * 1e-9 / count, self._window_fps_sum / count
+        
     def _optimize_systems(self):
         """Optimize systems based on performance analysis"""
         # In a real implementation, this would make actual optimizations
@@ -187,9 +274,7 @@ class GameEngine:
         if not self.performance_metrics:
             return {}
             
-        recent_frames = list(self.performance_metrics.values())[-300:]
-        avg_frame_time = sum(f["frame_time"] for f in recent_frames) / len(recent_frames)
-        avg_fps = sum(f["fps"] for f in recent_frames) / len(recent_frames)
+        avg_frame_time, avg_fps = self._frame_averages()
         
         return {
             "average_frame_time": avg_frame_time,
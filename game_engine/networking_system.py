@@ -5,15 +5,115 @@ Multiplayer networking and blockchain integration
 
 import time
 import json
-import hashlib
+import math
+import logging
+import queue
+import secrets
 import threading
 import socket
+import selectors
+import struct
 import random
-from typing import Dict, List, Tuple, Any, Callable
+from collections import deque
+from typing import Dict, List, Tuple, Any, Callable, Deque, Optional
 from dataclasses import dataclass, field
 from .engine_core import EngineSystem
 
-@dataclass
+_LOG = logging.getLogger(__name__)
+
+# Shared compact encoder for outgoing packets
+_encode_packet = json.JSONEncoder(separators=(",", ":")).encode
+
+# Packets travel as a big-endian uint32 length followed by the JSON payload
+_FRAME_HEADER = struct.Struct("!I")
+_MAX_FRAME_SIZE = 1 << 20
+
+# Smoothing factor for the latency and loss moving averages
+_EWMA_ALPHA = 0.1
+
+# Client-reported ping times are clamped to this many seconds
+_MAX_PING_SAMPLE = 10.0
+
+# Packet rate adaptation runs every _ADAPT_INTERVAL ping samples and only adjusts
+# after _ADAPT_CONFIRMATIONS consecutive evaluations agree (hysteresis)
+_ADAPT_INTERVAL = 10
+_ADAPT_CONFIRMATIONS = 3
+
+def _frame_packet(packet: Dict[str, Any]) -> bytes:
+    """Encode a packet as a length-prefixed JSON frame"""
+    payload = _encode_packet(packet).encode('utf-8')
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+class _FrameReader:
+    """Reassembles length-prefixed frames from a stream socket"""
+    __slots__ = ("buffer", "view", "fill")
+    
+    def __init__(self, capacity: int = 65536):
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+        self.fill = 0
+        
+    def recv_from(self, sock: socket.socket) -> int:
+        """Read available bytes into the buffer, returning 0 on EOF"""
+        if self.fill == len(self.buffer):
+            self._grow(2 * len(self.buffer))
+        received = sock.recv_into(self.view[self.fill:])
+        self.fill += received
+        return received
+        
+    def frames(self) -> List[bytes]:
+        """Pop every complete frame payload from the buffer"""
+        buffer, fill = self.buffer, self.fill
+        header_size = _FRAME_HEADER.size
+        payloads = []
+        start = 0
+        while fill - start >= header_size:
+            (length,) = _FRAME_HEADER.unpack_from(buffer, start)
+            if length > _MAX_FRAME_SIZE:
+                raise ValueError(f"frame of {length} bytes exceeds the {_MAX_FRAME_SIZE} byte limit")
+            end = start + header_size + length
+            if end > fill:
+                if end > len(buffer):
+                    self._grow(end - start)
+                break
+            payloads.append(bytes(self.view[start + header_size:end]))
+            start = end
+            
+        # Shift any partial frame to the front
+        if start:
+            remaining = self.fill - start
+            self.buffer[:remaining] = self.buffer[start:self.fill]
+            self.fill = remaining
+        return payloads
+        
+    def _grow(self, capacity: int):
+        """Reallocate the buffer; the memoryview export forbids resizing in place"""
+        capacity = max(capacity, len(self.buffer))
+        buffer = bytearray(capacity)
+        buffer[:self.fill] = self.view[:self.fill]
+        self.view.release()
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+
+class _ClientState:
+    """Per-connection state owned by the server's selector loop"""
+    __slots__ = ("client_id", "sock", "reader")
+    
+    def __init__(self, client_id: str, sock: socket.socket):
+        self.client_id = client_id
+        self.sock = sock
+        self.reader = _FrameReader()
+
+class _TrafficCounters:
+    """Running traffic totals written only by their owning thread"""
+    __slots__ = ("packets_sent", "bytes_sent", "bytes_received")
+    
+    def __init__(self):
+        self.packets_sent = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+@dataclass(slots=True)
 class NetworkSettings:
     server_port: int = 8080
     max_connections: int = 100
@@ -23,18 +123,18 @@ class NetworkSettings:
     blockchain_sync_interval: float = 5.0  # seconds
     ping_interval: float = 1.0  # seconds
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionInfo:
     client_id: str
     address: Tuple[str, int]
-    connected_time: float
-    last_ping: float
+    connected_time: float  # time.monotonic() seconds
+    last_ping: float  # time.monotonic() seconds
     ping: float = 0.0
     packet_loss: float = 0.0
     bytes_sent: int = 0
     bytes_received: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class BlockchainConfig:
     rpc_endpoint: str = "http://localhost:8545"
     contract_addresses: Dict[str, str] = field(default_factory=dict)
@@ -42,7 +142,7 @@ class BlockchainConfig:
     private_key: str = ""
     network_id: int = 1  # 1=mainnet, 3=ropsten, 4=rinkeby, etc.
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStats:
     active_connections: int = 0
     total_connections: int = 0
@@ -59,31 +159,43 @@ class NetworkingSystem(EngineSystem):
         self.blockchain_config = BlockchainConfig()
         self.stats = NetworkStats()
         
+        # Per-thread traffic counters, folded into stats once per tick
+        self._local = threading.local()
+        self._traffic_counters: List[_TrafficCounters] = []
+        self._traffic_lock = threading.Lock()  # guards registration only
+        
         # Connection management
         self.connections: Dict[str, ConnectionInfo] = {}
         self.client_callbacks: Dict[str, Callable] = {}
         
         # Server components
-        self.server_socket = None
+        self.server_socket: Optional[socket.socket] = None
         self.server_running = False
-        self.server_thread = None
+        self.server_thread: Optional[threading.Thread] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._client_states: Dict[str, _ClientState] = {}
+        self._pending_closes: Deque[str] = deque()  # client ids whose sockets the loop must close
         
         # Blockchain integration
         self.blockchain_connected = False
-        self.contract_interfaces = {}
-        self.pending_transactions = {}
-        self.last_blockchain_sync = 0.0
+        self.contract_interfaces: Dict[str, str] = {}
+        self.pending_transactions: Dict[str, Dict[str, Any]] = {}
+        self.last_blockchain_sync = float("-inf")  # time.monotonic() seconds
         
         # Self-improvement components
         self.network_optimization_enabled = True
         self.adaptive_compression = True
-        self.performance_history = []
-        self.optimization_suggestions = []
+        self._ewma_latency = 0.0  # seconds
+        self._latency_samples = 0  # Pings folded into the moving averages
+        self._last_adapt_sample = 0
+        self._adapt_pressure = 0  # consecutive high (+) or low (-) latency evaluations
+        self._ewma_loss = 0.0  # fraction of packets lost, as reported by clients
+        self.optimization_suggestions: List[Any] = []
         
         # Packet handling
-        self.packet_handlers = {}
-        self.packet_queue = []
-        self.packet_processing_thread = None
+        self.packet_handlers: Dict[str, Callable[[str, Dict[str, Any]], None]] = {}
+        self.packet_queue: "queue.SimpleQueue[Dict[str, Any]]" = queue.SimpleQueue()  # producers call put_nowait from any thread
+        self.packet_processing_thread: Optional[threading.Thread] = None
         self.packet_processing_running = False
         
     def initialize(self):
@@ -135,14 +247,18 @@ class NetworkingSystem(EngineSystem):
             
     def update(self, delta_time: float):
         """Update the networking system"""
+        # Read the clock once per tick
+        now = time.monotonic()
+        
         # Process packet queue
         self._process_packet_queue()
+        self._flush_traffic_counters()
         
         # Update connection status
-        self._update_connections(delta_time)
+        self._update_connections(delta_time, now)
         
         # Sync with blockchain periodically
-        if time.time() - self.last_blockchain_sync > self.settings.blockchain_sync_interval:
+        if now - self.last_blockchain_sync > self.settings.blockchain_sync_interval:
             self._sync_with_blockchain()
             
         # Adapt network parameters based on performance
@@ -153,21 +269,22 @@ class NetworkingSystem(EngineSystem):
         """Process queued packets"""
         # In a real implementation, this would process network packets
         # For now, we'll just clear the queue
-        processed_packets = min(10, len(self.packet_queue))
-        for i in range(processed_packets):
-            packet = self.packet_queue.pop(0)
+        get_packet = self.packet_queue.get_nowait
+        for _ in range(10):
+            try:
+                packet = get_packet()
+            except queue.Empty:
+                break
             self.stats.packets_received += 1
             
-    def _update_connections(self, delta_time: float):
+    def _update_connections(self, delta_time: float, now: float):
         """Update connection status"""
-        current_time = time.time()
-        
-        # Update connection info
-        for conn_id, conn in list(self.connections.items()):
-            # Check for timeout
-            if current_time - conn.last_ping > 30.0:  # 30 second timeout
-                print(f"Connection {conn_id} timed out")
-                self._disconnect_client(conn_id)
+        # Check for timeouts over a snapshot: server threads add and drop connections concurrently
+        cutoff = now - 30.0  # 30 second timeout
+        timed_out = [conn_id for conn_id, conn in tuple(self.connections.items()) if conn.last_ping < cutoff]
+        for conn_id in timed_out:
+            print(f"Connection {conn_id} timed out")
+            self._disconnect_client(conn_id)
                 
         # Update statistics
         self.stats.active_connections = len(self.connections)
@@ -184,7 +301,7 @@ class NetworkingSystem(EngineSystem):
             # Simulate blockchain operations
             time.sleep(0.05)
             self.stats.blockchain_syncs += 1
-            self.last_blockchain_sync = time.time()
+            self.last_blockchain_sync = time.monotonic()
             
             print("Blockchain sync completed")
             
@@ -194,22 +311,37 @@ class NetworkingSystem(EngineSystem):
     def _adapt_network_parameters(self):
         """Adapt network parameters based on performance"""
         # This is where the self-improvement happens
-        if len(self.performance_history) < 10:
+        samples = self._latency_samples
+        if samples - self._last_adapt_sample < _ADAPT_INTERVAL:
             return
-            
-        # Calculate average latency
-        recent_latencies = [p["latency"] for p in self.performance_history[-30:]]
-        avg_latency = sum(recent_latencies) / len(recent_latencies)
+        self._last_adapt_sample = samples
         
-        # Adjust packet rate based on latency
+        # Smoothed latency from client pings, which must stay on one side of the
+        # 20-100ms band for several consecutive evaluations
+        avg_latency = self._ewma_latency
         if avg_latency > 0.1:  # 100ms
-            # Reduce packet rate to reduce network load
-            self.settings.packet_rate = max(20, self.settings.packet_rate - 5)
-            print(f"Reducing packet rate to {self.settings.packet_rate} Hz due to high latency")
+            self._adapt_pressure = max(1, self._adapt_pressure + 1)
         elif avg_latency < 0.02:  # 20ms
+            self._adapt_pressure = min(-1, self._adapt_pressure - 1)
+        else:
+            self._adapt_pressure = 0
+        if abs(self._adapt_pressure) < _ADAPT_CONFIRMATIONS:
+            return
+        high_latency = self._adapt_pressure > 0
+        self._adapt_pressure = 0
+        
+        # Adjust packet rate based on latency
+        old_rate = self.settings.packet_rate
+        if high_latency:
+            # Reduce packet rate to reduce network load
+            self.settings.packet_rate = max(20, old_rate - 5)
+            reason = "high"
+        else:
             # Increase packet rate for better responsiveness
-            self.settings.packet_rate = min(120, self.settings.packet_rate + 5)
-            print(f"Increasing packet rate to {self.settings.packet_rate} Hz due to low latency")
+            self.settings.packet_rate = min(120, old_rate + 5)
+            reason = "low"
+        if self.settings.packet_rate != old_rate:
+            _LOG.debug("Packet rate set to %s Hz due to %s latency", self.settings.packet_rate, reason)
             
     def start_server(self):
         """Start the game server"""
@@ -220,8 +352,16 @@ class NetworkingSystem(EngineSystem):
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                # Lets several server processes share the port; the kernel spreads accepts
+                self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             self.server_socket.bind(('localhost', self.settings.server_port))
             self.server_socket.listen(self.settings.max_connections)
+            self.server_socket.setblocking(False)
+            
+            # One selector multiplexes the listening socket and every client
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.server_socket, selectors.EVENT_READ)
             
             self.server_running = True
             self.server_thread = threading.Thread(target=self._server_loop)
@@ -238,8 +378,9 @@ class NetworkingSystem(EngineSystem):
         print("Stopping game server...")
         self.server_running = False
         
-        if self.server_socket:
-            self.server_socket.close()
+        # The selector loop closes its sockets on the way out
+        if self.server_thread and self.server_thread is not threading.current_thread():
+            self.server_thread.join(timeout=1.0)
             
         # Disconnect all clients
         for client_id in list(self.connections.keys()):
@@ -248,73 +389,109 @@ class NetworkingSystem(EngineSystem):
         print("Game server stopped")
         
     def _server_loop(self):
-        """Main server loop"""
-        while self.server_running:
-            try:
-                # Accept new connections
-                client_socket, address = self.server_socket.accept()
-                
-                # Create new client connection
-                client_id = f"client_{hashlib.md5(str(address).encode()).hexdigest()[:8]}"
-                conn_info = ConnectionInfo(
-                    client_id=client_id,
-                    address=address,
-                    connected_time=time.time(),
-                    last_ping=time.time()
-                )
-                
-                self.connections[client_id] = conn_info
-                self.stats.total_connections += 1
-                
-                print(f"New client connected: {client_id} from {address}")
-                
-                # Start client handler thread
-                client_thread = threading.Thread(target=self._handle_client, args=(client_socket, client_id))
-                client_thread.daemon = True
-                client_thread.start()
-                
-            except Exception as e:
-                if self.server_running:
-                    print(f"Error accepting client connection: {e}")
-                    
-    def _handle_client(self, client_socket, client_id: str):
-        """Handle client communication"""
+        """Main server loop: a single selector serves accepts and client reads"""
+        selector = self._selector
         try:
-            while client_id in self.connections and self.server_running:
-                # Receive data from client
-                try:
-                    data = client_socket.recv(1024)
-                    if not data:
-                        break
+            while self.server_running:
+                for key, _ in selector.select(timeout=0.1):
+                    if key.data is None:
+                        self._accept_client()
+                    else:
+                        self._read_client(key.data)
+                        
+                # Close sockets of clients dropped elsewhere (timeouts, stop_server)
+                while self._pending_closes:
+                    state = self._client_states.pop(self._pending_closes.popleft(), None)
+                    if state is not None:
+                        self._close_client_socket(state)
                         
-                    self.stats.bytes_received += len(data)
-                    
-                    # Process received data
-                    self._process_client_data(client_id, data)
-                    
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    print(f"Error receiving data from {client_id}: {e}")
-                    break
-                    
         except Exception as e:
-            print(f"Error handling client {client_id}: {e}")
+            if self.server_running:
+                print(f"Error in server loop: {e}")
         finally:
-            # Clean up connection
-            self._disconnect_client(client_id)
-            client_socket.close()
+            for state in list(self._client_states.values()):
+                self._close_client_socket(state)
+            self._client_states.clear()
+            selector.close()
+            self.server_socket.close()
+            
+    def _accept_client(self):
+        """Accept a pending connection and register it with the selector"""
+        try:
+            client_socket, address = self.server_socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            if self.server_running:
+                print(f"Error accepting client connection: {e}")
+            return
+            
+        client_socket.setblocking(False)
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # small packets go out immediately
+        
+        # Create new client connection; ids are opaque, not derived from the address
+        client_id = f"client_{secrets.token_hex(4)}"
+        while client_id in self.connections:
+            client_id = f"client_{secrets.token_hex(4)}"
+        now = time.monotonic()
+        conn_info = ConnectionInfo(
+            client_id=client_id,
+            address=address,
+            connected_time=now,
+            last_ping=now
+        )
+        
+        self.connections[client_id] = conn_info
+        self.stats.total_connections += 1
+        
+        state = _ClientState(client_id, client_socket)
+        self._client_states[client_id] = state
+        self._selector.register(client_socket, selectors.EVENT_READ, state)
+        
+        print(f"New client connected: {client_id} from {address}")
+        
+    def _read_client(self, state: _ClientState):
+        """Handle a read-ready client socket"""
+        client_id = state.client_id
+        try:
+            received = state.reader.recv_from(state.sock)
+            if received:
+                self._counters().bytes_received += received
+                
+                # Process every complete packet in the buffer
+                for payload in state.reader.frames():
+                    self._process_client_data(client_id, payload)
+                return
+                
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            print(f"Error receiving data from {client_id}: {e}")
+            
+        # Peer closed or the stream is unusable; clean up connection
+        self._client_states.pop(client_id, None)
+        self._close_client_socket(state)
+        self._disconnect_client(client_id)
+        
+    def _close_client_socket(self, state: _ClientState):
+        """Unregister and close a client socket"""
+        try:
+            self._selector.unregister(state.sock)
+        except (KeyError, ValueError):
+            pass
+        state.sock.close()
             
     def _process_client_data(self, client_id: str, data: bytes):
         """Process data received from client"""
         try:
-            # Decode JSON data
-            message = json.loads(data.decode('utf-8'))
+            # Decode JSON data (json.loads detects UTF-8 bytes itself)
+            message = json.loads(data)
             
-            # Handle packet based on type
+            # Handle packet based on type with a single handler lookup
             packet_type = message.get("type", "unknown")
-            if packet_type in self.packet_handlers:
-                self.packet_handlers[packet_type](client_id, message)
+            handler = self.packet_handlers.get(packet_type)
+            if handler is not None:
+                handler(client_id, message)
             else:
                 print(f"Unknown packet type from {client_id}: {packet_type}")
                 
@@ -323,12 +500,23 @@ class NetworkingSystem(EngineSystem):
         except Exception as e:
             print(f"Error processing client data from {client_id}: {e}")
             
-    def _handle_ping(self, client_id: str, message: Dict):
+    def _handle_ping(self, client_id: str, message: Dict[str, Any]):
         """Handle ping packet"""
         # Update connection info
-        if client_id in self.connections:
-            self.connections[client_id].last_ping = time.time()
-            self.connections[client_id].ping = message.get("ping_time", 0)
+        conn = self.connections.get(client_id)
+        if conn is not None:
+            conn.last_ping = time.monotonic()
+            conn.packet_loss = min(1.0, max(0.0, message.get("packet_loss", conn.packet_loss)))
+            
+            # Fold the samples into the moving averages behind the performance rating;
+            # a non-finite ping would poison the latency average, so it is dropped
+            self._ewma_loss += _EWMA_ALPHA * (conn.packet_loss - self._ewma_loss)
+            ping = float(message.get("ping_time", 0))
+            if math.isfinite(ping):
+                conn.ping = min(_MAX_PING_SAMPLE, max(0.0, ping))
+                self._ewma_latency += _EWMA_ALPHA * (conn.ping - self._ewma_latency)
+                self.stats.avg_latency = self._ewma_latency
+                self._latency_samples += 1
             
         # Send pong response
         response = {
@@ -337,7 +525,7 @@ class NetworkingSystem(EngineSystem):
         }
         self.send_packet(client_id, response)
         
-    def _handle_player_update(self, client_id: str, message: Dict):
+    def _handle_player_update(self, client_id: str, message: Dict[str, Any]):
         """Handle player update packet"""
         # Process player state update
         player_data = message.get("player_data", {})
@@ -351,7 +539,7 @@ class NetworkingSystem(EngineSystem):
         }
         self.send_packet(client_id, response)
         
-    def _handle_chat_message(self, client_id: str, message: Dict):
+    def _handle_chat_message(self, client_id: str, message: Dict[str, Any]):
         """Handle chat message packet"""
         chat_data = message.get("chat_data", {})
         
@@ -362,10 +550,13 @@ class NetworkingSystem(EngineSystem):
             "sender": client_id
         }
         
-        for conn_id in self.connections:
-            self.send_packet(conn_id, broadcast_message)
+        # Serialize once and send the same frame to every client
+        frame = _frame_packet(broadcast_message)
+        send_raw = self.send_raw
+        for conn_id in tuple(self.connections):
+            send_raw(conn_id, frame)
             
-    def _handle_quest_progress(self, client_id: str, message: Dict):
+    def _handle_quest_progress(self, client_id: str, message: Dict[str, Any]):
         """Handle quest progress packet"""
         quest_data = message.get("quest_data", {})
         
@@ -379,10 +570,12 @@ class NetworkingSystem(EngineSystem):
         }
         self.send_packet(client_id, response)
         
-    def _handle_transaction_request(self, client_id: str, message: Dict):
+    def _handle_transaction_request(self, client_id: str, message: Dict[str, Any]):
         """Handle blockchain transaction request"""
         tx_data = message.get("transaction_data", {})
         
+        timestamp = time.time()
+        
         # Process blockchain transaction
         if self.blockchain_connected:
             # In a real implementation, this would send a transaction to the blockchain
@@ -393,7 +586,7 @@ class NetworkingSystem(EngineSystem):
             self.pending_transactions[tx_id] = {
                 "client_id": client_id,
                 "data": tx_data,
-                "timestamp": time.time()
+                "timestamp": timestamp
             }
             
             # Send transaction confirmation
@@ -401,7 +594,7 @@ class NetworkingSystem(EngineSystem):
                 "type": "transaction_confirmed",
                 "transaction_id": tx_id,
                 "status": "pending",
-                "timestamp": time.time()
+                "timestamp": timestamp
             }
             self.send_packet(client_id, response)
         else:
@@ -409,32 +602,58 @@ class NetworkingSystem(EngineSystem):
             response = {
                 "type": "transaction_error",
                 "error": "Blockchain not connected",
-                "timestamp": time.time()
+                "timestamp": timestamp
             }
             self.send_packet(client_id, response)
             
-    def send_packet(self, client_id: str, packet: Dict):
+    def send_packet(self, client_id: str, packet: Dict[str, Any]):
         """Send packet to client"""
         if client_id not in self.connections:
             return
             
         try:
-            # Encode packet as JSON
-            data = json.dumps(packet).encode('utf-8')
-            
-            # In a real implementation, this would send data through the socket
-            # For now, we'll just update statistics
-            self.stats.packets_sent += 1
-            self.stats.bytes_sent += len(data)
+            # Encode packet as a JSON frame
+            self.send_raw(client_id, _frame_packet(packet))
             
         except Exception as e:
             print(f"Error sending packet to {client_id}: {e}")
             
+    def send_raw(self, client_id: str, frame: bytes):
+        """Send an already framed packet to client"""
+        if client_id not in self.connections:
+            return
+            
+        # In a real implementation, this would send data through the socket
+        # For now, we'll just update statistics
+        counters = self._counters()
+        counters.packets_sent += 1
+        counters.bytes_sent += len(frame)
+        
+    def _counters(self) -> _TrafficCounters:
+        """Get the calling thread's traffic counters"""
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = self._local.counters = _TrafficCounters()
+            with self._traffic_lock:
+                self._traffic_counters.append(counters)
+            return counters
+            
+    def _flush_traffic_counters(self):
+        """Fold the per-thread traffic counters into stats"""
+        with self._traffic_lock:
+            counters = tuple(self._traffic_counters)
+        # Counters only ever grow, so summing them needs no reset handshake
+        self.stats.packets_sent = sum(c.packets_sent for c in counters)
+        self.stats.bytes_sent = sum(c.bytes_sent for c in counters)
+        self.stats.bytes_received = sum(c.bytes_received for c in counters)
+            
     def _disconnect_client(self, client_id: str):
         """Disconnect client"""
         if client_id in self.connections:
             print(f"Client {client_id} disconnected")
             del self.connections[client_id]
+            self._pending_closes.append(client_id)
             
     def register_client_callback(self, event_type: str, callback: Callable):
         """Register callback for client events"""
@@ -442,25 +661,14 @@ class NetworkingSystem(EngineSystem):
         
     def get_network_stats(self) -> NetworkStats:
         """Get current network statistics"""
+        self._flush_traffic_counters()
         return self.stats.copy() if hasattr(self.stats, 'copy') else self.stats
         
     def get_performance_rating(self) -> float:
         """Get networking performance rating (0.0 to 1.0)"""
-        # Performance rating based on latency and packet loss
-        if self.stats.packets_sent == 0:
-            return 1.0
-            
-        # Calculate packet loss percentage
-        packet_loss = 0.0
-        if self.stats.packets_sent > 0:
-            packet_loss = min(1.0, self.stats.packets_received / max(1, self.stats.packets_sent))
-            
-        # Calculate latency rating (target < 50ms)
-        latency_rating = max(0.0, min(1.0, 1.0 - (self.stats.avg_latency / 0.05)))
-        
-        # Combine ratings
-        performance_rating = (latency_rating * 0.7) + (packet_loss * 0.3)
-        return performance_rating
+        # Performance rating based on smoothed latency (target < 50ms) and packet loss
+        latency_rating = max(0.0, 1.0 - self._ewma_latency / 0.05)
+        return min(1.0, 0.7 * latency_rating + 0.3 * (1.0 - self._ewma_loss))
         
     def set_blockchain_config(self, config: BlockchainConfig):
         """Set blockchain configuration"""
@@ -4,12 +4,25 @@ Physical simulation and collision detection
 """
 
 import time
-import random
 import math
+import logging
+from array import array
+from collections import deque
+from collections.abc import MutableMapping
 from typing import Dict, List, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from .engine_core import EngineSystem
 
+_LOG = logging.getLogger(__name__)
+
+# Minimum seconds between adaptive-quality log messages
+_ADAPT_LOG_INTERVAL = 1.0
+
+# Adaptive quality runs every _ADAPT_INTERVAL steps and only adjusts after
+# _ADAPT_CONFIRMATIONS consecutive evaluations agree (hysteresis)
+_ADAPT_INTERVAL = 30
+_ADAPT_CONFIRMATIONS = 3
+
 @dataclass
 class PhysicsSettings:
     gravity: Tuple[float, float, float] = (0.0, -9.81, 0.0)
@@ -18,7 +31,7 @@ class PhysicsSettings:
     enable_collision_detection: bool = True
     enable_constraints: bool = True
     
-@dataclass
+@dataclass(slots=True)
 class RigidBody:
     id: str
     position: Tuple[float, float, float] = (0.0, 0.0, 0.0)
@@ -31,7 +44,7 @@ class RigidBody:
     is_static: bool = False
     is_kinematic: bool = False
     
-@dataclass
+@dataclass(slots=True)
 class Collision:
     body_a: str
     body_b: str
@@ -39,6 +52,217 @@ class Collision:
     normal: Tuple[float, float, float]
     penetration_depth: float
     
+@dataclass(slots=True)
+class CollisionBatch:
+    """Contacts from one detection pass as parallel columns (three floats per vector)"""
+    body_ids: List[str]  # Row index -> body id at detection time
+    index_a: array = field(default_factory=lambda: array('l'))
+    index_b: array = field(default_factory=lambda: array('l'))
+    contact_points: array = field(default_factory=lambda: array('d'))
+    normals: array = field(default_factory=lambda: array('d'))  # Unit length, from a to b
+    penetration_depths: array = field(default_factory=lambda: array('d'))
+    
+    def __len__(self) -> int:
+        return len(self.index_a)
+        
+    def __iter__(self):
+        """Yield each contact as a Collision record"""
+        points, normals = self.contact_points, self.normals
+        for n, (a, b) in enumerate(zip(self.index_a, self.index_b)):
+            k = 3 * n
+            yield Collision(
+                body_a=self.body_ids[a],
+                body_b=self.body_ids[b],
+                contact_point=(points[k], points[k + 1], points[k + 2]),
+                normal=(normals[k], normals[k + 1], normals[k + 2]),
+                penetration_depth=self.penetration_depths[n]
+            )
+            
+# Body state columns hold single-precision floats: half the memory of Python
+# floats, ample for game physics. simulation_time stays double precision.
+_STATE_TYPECODE = 'f'
+
+def _vector_column(column: str) -> property:
+    """Expose three consecutive floats of a PhysicsSystem column as a tuple"""
+    def fget(self):
+        col = getattr(self._physics, column)
+        i = 3 * self._physics._index[self.id]
+        return (col[i], col[i + 1], col[i + 2])
+        
+    def fset(self, value):
+        col = getattr(self._physics, column)
+        i = 3 * self._physics._index[self.id]
+        col[i:i + 3] = array(_STATE_TYPECODE, value)
+        
+    return property(fget, fset)
+
+def _scalar_column(column: str, kind: type = float) -> property:
+    """Expose one entry of a PhysicsSystem column"""
+    def fget(self):
+        return kind(getattr(self._physics, column)[self._physics._index[self.id]])
+        
+    def fset(self, value):
+        getattr(self._physics, column)[self._physics._index[self.id]] = value
+        
+    return property(fget, fset)
+
+def _flag_column(column: str) -> property:
+    """Expose a static/kinematic flag; setting it may move the body's row"""
+    def fget(self):
+        return bool(getattr(self._physics, column)[self._physics._index[self.id]])
+        
+    def fset(self, value):
+        self._physics._set_body_flag(self.id, column, value)
+        
+    return property(fget, fset)
+
+def _sweep_sphere_pairs(xs, ys, zs, limit_sq: float) -> List[Tuple[int, int, float]]:
+    """All index pairs i < j closer than sqrt(limit_sq), with their squared distance"""
+    # Sort and sweep along x: once a body is out of reach on x, so are all later ones
+    reach = math.sqrt(limit_sq)
+    order = sorted(range(len(xs)), key=xs.__getitem__)
+    sorted_xs = [xs[i] for i in order]
+    count = len(order)
+    pairs = []
+    for n in range(count):
+        i = order[n]
+        ax, ay, az = sorted_xs[n], ys[i], zs[i]
+        stop = ax + reach
+        m = n + 1
+        while m < count and sorted_xs[m] < stop:
+            j = order[m]
+            d = (ax - sorted_xs[m]) ** 2 + (ay - ys[j]) ** 2 + (az - zs[j]) ** 2
+            if d < limit_sq:
+                pairs.append((i, j, d) if i < j else (j, i, d))
+            m += 1
+            
+    # Report pairs in index order
+    pairs.sort()
+    return pairs
+
+def _integrate_kernel(pos, vel, rot, ang_vel, count: int, dv: Tuple[float, float, float], dt: float):
+    """Symplectic Euler step for the first count bodies"""
+    # Position advances with the updated velocity; each row is touched once
+    dvx, dvy, dvz = dv
+    for k in range(0, 3 * count, 3):
+        vx = vel[k] + dvx
+        vy = vel[k + 1] + dvy
+        vz = vel[k + 2] + dvz
+        vel[k] = vx
+        vel[k + 1] = vy
+        vel[k + 2] = vz
+        pos[k] += vx * dt
+        pos[k + 1] += vy * dt
+        pos[k + 2] += vz * dt
+        rot[k] += ang_vel[k] * dt
+        rot[k + 1] += ang_vel[k + 1] * dt
+        rot[k + 2] += ang_vel[k + 2] * dt
+
+# Penetration tolerated without correction, and the share of the rest removed per step
+_CONTACT_SLOP = 0.01
+_POSITION_CORRECTION = 0.8
+
+# Scenes at least this large use the spatial hash instead of sort and sweep;
+# below it, sorting beats building the hash
+_SPATIAL_HASH_MIN_BODIES = 128
+
+# The 13 neighbouring cell offsets lexicographically after (0, 0, 0); visiting
+# only these from every cell reaches each adjacent cell pair exactly once
+_HALF_NEIGHBOURHOOD = tuple(
+    (dx, dy, dz)
+    for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+    if (dx, dy, dz) > (0, 0, 0)
+)
+
+def _grid_sphere_pairs(xs, ys, zs, limit_sq: float) -> List[Tuple[int, int, float]]:
+    """Like _sweep_sphere_pairs, but only tests bodies in the same or adjacent hash cells"""
+    # Cells as wide as the contact distance keep every contact within one cell of each other
+    inv_cell = 1.0 / math.sqrt(limit_sq)
+    floor = math.floor
+    grid: Dict[Tuple[int, int, int], List[int]] = {}
+    for i, (x, y, z) in enumerate(zip(xs, ys, zs)):
+        key = (floor(x * inv_cell), floor(y * inv_cell), floor(z * inv_cell))
+        members = grid.get(key)
+        if members is None:
+            grid[key] = [i]
+        else:
+            members.append(i)
+            
+    pairs = []
+    for (cx, cy, cz), members in grid.items():
+        # Pairs within the cell
+        for n, i in enumerate(members):
+            ax, ay, az = xs[i], ys[i], zs[i]
+            for j in members[n + 1:]:
+                d = (ax - xs[j]) ** 2 + (ay - ys[j]) ** 2 + (az - zs[j]) ** 2
+                if d < limit_sq:
+                    pairs.append((i, j, d))
+                    
+        # Pairs with the forward half of the neighbouring cells
+        for dx, dy, dz in _HALF_NEIGHBOURHOOD:
+            others = grid.get((cx + dx, cy + dy, cz + dz))
+            if others is None:
+                continue
+            for i in members:
+                ax, ay, az = xs[i], ys[i], zs[i]
+                for j in others:
+                    d = (ax - xs[j]) ** 2 + (ay - ys[j]) ** 2 + (az - zs[j]) ** 2
+                    if d < limit_sq:
+                        pairs.append((i, j, d) if i < j else (j, i, d))
+                        
+    # Report pairs in index order
+    pairs.sort()
+    return pairs
+
+class RigidBodyView:
+    """Live view of one rigid body's row in the physics column storage"""
+    __slots__ = ("_physics", "id")
+    
+    def __init__(self, physics: "PhysicsSystem", body_id: str):
+        self._physics = physics
+        self.id = body_id
+        
+    position = _vector_column("pos")
+    rotation = _vector_column("rot")
+    velocity = _vector_column("vel")
+    angular_velocity = _vector_column("ang_vel")
+    mass = _scalar_column("mass")
+    friction = _scalar_column("friction")
+    restitution = _scalar_column("restitution")
+    is_static = _flag_column("static_mask")
+    is_kinematic = _flag_column("kinematic_mask")
+    
+    def __repr__(self) -> str:
+        return f"RigidBodyView(id={self.id!r}, position={self.position}, velocity={self.velocity})"
+
+class _BodyMap(MutableMapping):
+    """Dict-style access to rigid bodies; assignment and deletion add and remove bodies"""
+    __slots__ = ("_physics",)
+    
+    def __init__(self, physics: "PhysicsSystem"):
+        self._physics = physics
+        
+    def __getitem__(self, body_id: str) -> RigidBodyView:
+        return self._physics.get_rigid_body(body_id)
+        
+    def __setitem__(self, body_id: str, body: RigidBody):
+        self._physics.add_rigid_body(body_id, body)
+        
+    def __delitem__(self, body_id: str):
+        if body_id not in self._physics._index:
+            raise KeyError(body_id)
+        self._physics.remove_rigid_body(body_id)
+        
+    def __contains__(self, body_id: object) -> bool:
+        return body_id in self._physics._index
+        
+    def __iter__(self):
+        # Iterate a copy: adding or removing bodies reorders the rows
+        return iter(list(self._physics.body_ids))
+        
+    def __len__(self) -> int:
+        return len(self._physics.body_ids)
+
 @dataclass
 class PhysicsStats:
     bodies_count: int = 0
@@ -51,32 +275,60 @@ class PhysicsSystem(EngineSystem):
     def __init__(self):
         self.settings = PhysicsSettings()
         self.stats = PhysicsStats()
-        self.bodies: Dict[str, RigidBody] = {}
+        
+        # Rigid bodies are stored as parallel columns (structure of arrays);
+        # vector columns hold three consecutive floats per body
+        self.body_ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.pos = array(_STATE_TYPECODE)
+        self.rot = array(_STATE_TYPECODE)
+        self.vel = array(_STATE_TYPECODE)
+        self.ang_vel = array(_STATE_TYPECODE)
+        self.mass = array(_STATE_TYPECODE)
+        self.friction = array(_STATE_TYPECODE)
+        self.restitution = array(_STATE_TYPECODE)
+        self.static_mask = bytearray()
+        self.kinematic_mask = bytearray()
+        
+        # Rows are partitioned: dynamic bodies first, then kinematic and static ones
+        self._dynamic_count = 0
+        
+        # Per-step constants, refreshed when gravity or the simulation rate change
+        self._gravity_dv = (0.0, 0.0, 0.0)
+        self._target_step_time = 0.0
+        self._recompute_step_constants()
+        
         self.colliders = {}
         self.constraints = {}
         self.materials = {}
         
         # Simulation state
         self.simulation_time = 0.0
-        self.step_times = []
         self.max_step_times = 100
+        self.step_times = deque(maxlen=self.max_step_times)
+        self._step_time_sum = 0.0
+        self._recent_step_times = deque(maxlen=30)  # Window for adaptation and rating
+        self._recent_step_sum = 0.0
         
         # Self-improvement variables
         self.optimization_level = 1.0
         self.adaptive_substepping = True
         self.performance_history = []
+        self._last_adapt_log = float("-inf")  # time.monotonic() seconds
+        self._last_adapt_step = 0
+        self._adapt_pressure = 0  # consecutive slow (+) or fast (-) evaluations
         
     def initialize(self):
         """Initialize the physics system"""
-        print("Initializing Physics System...")
-        print(f"  Gravity: {self.settings.gravity}")
-        print(f"  Simulation Rate: {self.settings.simulation_rate} Hz")
-        print(f"  Max Substeps: {self.settings.max_substeps}")
+        _LOG.info("Initializing Physics System...")
+        _LOG.info("  Gravity: %s", self.settings.gravity)
+        _LOG.info("  Simulation Rate: %s Hz", self.settings.simulation_rate)
+        _LOG.info("  Max Substeps: %s", self.settings.max_substeps)
         
         # Create default materials
         self._create_default_materials()
         
-        print("Physics System initialized successfully")
+        _LOG.info("Physics System initialized successfully")
         
     def _create_default_materials(self):
         """Create default physics materials"""
@@ -109,21 +361,24 @@ class PhysicsSystem(EngineSystem):
         # Update statistics
         self.stats.simulation_steps += 1
         step_time = time.time() - step_start
+        if len(self.step_times) == self.step_times.maxlen:
+            self._step_time_sum -= self.step_times[0]
         self.step_times.append(step_time)
-        if len(self.step_times) > self.max_step_times:
-            self.step_times.pop(0)
+        self._step_time_sum += step_time
+        recent = self._recent_step_times
+        if len(recent) == recent.maxlen:
+            self._recent_step_sum -= recent[0]
+        recent.append(step_time)
+        self._recent_step_sum += step_time
             
-        self.stats.avg_step_time = sum(self.step_times) / len(self.step_times) if self.step_times else 0
+        self.stats.avg_step_time = self._step_time_sum / len(self.step_times)
         
         # Adapt simulation based on performance
         self._adapt_simulation()
         
     def _simulate(self, delta_time: float):
         """Perform physics simulation for the given time step"""
-        # Apply forces (gravity, etc.)
-        self._apply_forces()
-        
-        # Integrate velocities and positions
+        # Apply forces (gravity, etc.) and integrate in a single pass
         self._integrate(delta_time)
         
         # Detect and resolve collisions
@@ -139,158 +394,252 @@ class PhysicsSystem(EngineSystem):
         # Update simulation time
         self.simulation_time += delta_time
         
-    def _apply_forces(self):
-        """Apply forces to all rigid bodies"""
-        for body in self.bodies.values():
-            if not body.is_static and not body.is_kinematic:
-                # Apply gravity
-                body.velocity = (
-                    body.velocity[0] + self.settings.gravity[0] * (1/60),
-                    body.velocity[1] + self.settings.gravity[1] * (1/60),
-                    body.velocity[2] + self.settings.gravity[2] * (1/60)
-                )
-                
     def _integrate(self, delta_time: float):
-        """Integrate velocities and positions"""
-        for body in self.bodies.values():
-            if not body.is_static and not body.is_kinematic:
-                # Update position
-                body.position = (
-                    body.position[0] + body.velocity[0] * delta_time,
-                    body.position[1] + body.velocity[1] * delta_time,
-                    body.position[2] + body.velocity[2] * delta_time
-                )
+        """Apply gravity and integrate velocities, positions and rotations"""
+        _integrate_kernel(self.pos, self.vel, self.rot, self.ang_vel,
+                          self._dynamic_count, self._gravity_dv, delta_time)
                 
-                # Update rotation (simplified)
-                body.rotation = (
-                    body.rotation[0] + body.angular_velocity[0] * delta_time,
-                    body.rotation[1] + body.angular_velocity[1] * delta_time,
-                    body.rotation[2] + body.angular_velocity[2] * delta_time
-                )
-                
-    def _detect_collisions(self) -> List[Collision]:
+    def _detect_collisions(self) -> CollisionBatch:
         """Detect collisions between rigid bodies"""
-        collisions = []
-        
-        # Simplified collision detection for demonstration
-        body_list = list(self.bodies.values())
-        for i in range(len(body_list)):
-            for j in range(i + 1, len(body_list)):
-                body_a = body_list[i]
-                body_b = body_list[j]
-                
-                # Simple sphere collision detection
-                distance = math.sqrt(
-                    (body_a.position[0] - body_b.position[0]) ** 2 +
-                    (body_a.position[1] - body_b.position[1]) ** 2 +
-                    (body_a.position[2] - body_b.position[2]) ** 2
-                )
-                
-                # Assume radius of 1 for simplicity
-                if distance < 2.0:  # 1 + 1 = 2 (sum of radii)
-                    collision = Collision(
-                        body_a=body_a.id,
-                        body_b=body_b.id,
-                        contact_point=(
-                            (body_a.position[0] + body_b.position[0]) / 2,
-                            (body_a.position[1] + body_b.position[1]) / 2,
-                            (body_a.position[2] + body_b.position[2]) / 2
-                        ),
-                        normal=(
-                            body_b.position[0] - body_a.position[0],
-                            body_b.position[1] - body_a.position[1],
-                            body_b.position[2] - body_a.position[2]
-                        ),
-                        penetration_depth=2.0 - distance
-                    )
-                    collisions.append(collision)
+        batch = CollisionBatch(self.body_ids)
+        index_a, index_b = batch.index_a, batch.index_b
+        points, normals, depths = batch.contact_points, batch.normals, batch.penetration_depths
+        
+        # Simplified collision detection for demonstration; spheres of radius 1
+        pos = self.pos
+        xs, ys, zs = pos[0::3], pos[1::3], pos[2::3]
+        find_pairs = _grid_sphere_pairs if len(xs) >= _SPATIAL_HASH_MIN_BODIES else _sweep_sphere_pairs
+        for i, j, dist_sq in find_pairs(xs, ys, zs, 4.0):  # (1 + 1) ** 2
+            ax, ay, az = xs[i], ys[i], zs[i]
+            bx, by, bz = xs[j], ys[j], zs[j]
+            distance = math.sqrt(dist_sq)
+            index_a.append(i)
+            index_b.append(j)
+            points.extend(((ax + bx) / 2, (ay + by) / 2, (az + bz) / 2))
+            if distance > 0.0:
+                normals.extend(((bx - ax) / distance, (by - ay) / distance, (bz - az) / distance))
+            else:
+                normals.extend((0.0, 1.0, 0.0))  # Coincident centres: separate vertically
+            depths.append(2.0 - distance)
                     
-        return collisions
+        return batch
         
-    def _resolve_collisions(self, collisions: List[Collision]):
-        """Resolve detected collisions"""
-        for collision in collisions:
-            body_a = self.bodies[collision.body_a]
-            body_b = self.bodies[collision.body_b]
-            
-            # Skip if either body is static
-            if body_a.is_static and body_b.is_static:
+    def _resolve_collisions(self, batch: CollisionBatch):
+        """Resolve detected collisions with normal impulses and positional correction"""
+        pos, vel = self.pos, self.vel
+        mass, restitution = self.mass, self.restitution
+        static_mask, kinematic_mask = self.static_mask, self.kinematic_mask
+        normals = batch.normals
+        for n, (a, b, depth) in enumerate(zip(batch.index_a, batch.index_b, batch.penetration_depths)):
+            # Static and kinematic bodies have infinite mass
+            inv_a = 0.0 if static_mask[a] or kinematic_mask[a] or mass[a] <= 0.0 else 1.0 / mass[a]
+            inv_b = 0.0 if static_mask[b] or kinematic_mask[b] or mass[b] <= 0.0 else 1.0 / mass[b]
+            inv_sum = inv_a + inv_b
+            if inv_sum == 0.0:
                 continue
+            k = 3 * n
+            nx, ny, nz = normals[k], normals[k + 1], normals[k + 2]
+            
+            ka, kb = 3 * a, 3 * b
+            
+            # Impulse along the contact normal, only while the bodies approach
+            normal_speed = ((vel[kb] - vel[ka]) * nx + (vel[kb + 1] - vel[ka + 1]) * ny
+                            + (vel[kb + 2] - vel[ka + 2]) * nz)
+            if normal_speed < 0.0:
+                e = max(restitution[a], restitution[b])
+                impulse = -(1.0 + e) * normal_speed / inv_sum
+                ja, jb = impulse * inv_a, impulse * inv_b
+                vel[ka] -= ja * nx
+                vel[ka + 1] -= ja * ny
+                vel[ka + 2] -= ja * nz
+                vel[kb] += jb * nx
+                vel[kb + 1] += jb * ny
+                vel[kb + 2] += jb * nz
                 
-            # Simple collision response
-            if not body_a.is_static:
-                # Reflect velocity
-                body_a.velocity = (
-                    -body_a.velocity[0] * body_a.restitution,
-                    -body_a.velocity[1] * body_a.restitution,
-                    -body_a.velocity[2] * body_a.restitution
-                )
-                
-            if not body_b.is_static:
-                # Reflect velocity
-                body_b.velocity = (
-                    -body_b.velocity[0] * body_b.restitution,
-                    -body_b.velocity[1] * body_b.restitution,
-                    -body_b.velocity[2] * body_b.restitution
-                )
+            # Push the bodies apart to remove most of the penetration
+            correction = max(depth - _CONTACT_SLOP, 0.0) * _POSITION_CORRECTION / inv_sum
+            if correction:
+                ca, cb = correction * inv_a, correction * inv_b
+                pos[ka] -= ca * nx
+                pos[ka + 1] -= ca * ny
+                pos[ka + 2] -= ca * nz
+                pos[kb] += cb * nx
+                pos[kb + 1] += cb * ny
+                pos[kb + 2] += cb * nz
                 
     def _solve_constraints(self):
         """Solve physics constraints"""
         # In a real implementation, this would solve joints, limits, etc.
-        # For now, we'll just simulate the work
-        self.stats.constraints_solved = random.randint(0, 10)
-        time.sleep(0.001)  # Simulate constraint solving time
+        # For now, every registered constraint counts as solved
+        self.stats.constraints_solved = len(self.constraints)
         
     def _adapt_simulation(self):
         """Adapt simulation parameters based on performance"""
-        if len(self.step_times) < 30:
+        steps = self.stats.simulation_steps
+        if steps - self._last_adapt_step < _ADAPT_INTERVAL or len(self._recent_step_times) < 30:
             return
+        self._last_adapt_step = steps
             
         # Calculate average step time
-        recent_steps = self.step_times[-30:]
-        avg_step_time = sum(recent_steps) / len(recent_steps)
-        target_step_time = 1.0 / self.settings.simulation_rate
+        avg_step_time = self._recent_step_sum / len(self._recent_step_times)
+        target_step_time = self._target_step_time
         
-        # Adjust optimization level based on performance
+        # Require several consecutive evaluations on the same side of the deadband
         if avg_step_time > target_step_time * 1.2:  # 20% over target
+            self._adapt_pressure = max(1, self._adapt_pressure + 1)
+        elif avg_step_time < target_step_time * 0.8:  # 20% under target
+            self._adapt_pressure = min(-1, self._adapt_pressure - 1)
+        else:
+            self._adapt_pressure = 0
+        if abs(self._adapt_pressure) < _ADAPT_CONFIRMATIONS:
+            return
+        slow = self._adapt_pressure > 0
+        self._adapt_pressure = 0
+        
+        # Adjust optimization level based on performance
+        if slow:
             # Increase optimization (reduce quality for performance)
             self.optimization_level = max(0.5, self.optimization_level - 0.05)
-            print(f"Reducing physics quality to {self.optimization_level:.2f}")
-        elif avg_step_time < target_step_time * 0.8:  # 20% under target
+            self._log_adaptation("Reducing physics quality to %.2f", self.optimization_level)
+        else:
             # Decrease optimization (increase quality)
             self.optimization_level = min(1.5, self.optimization_level + 0.02)
-            print(f"Increasing physics quality to {self.optimization_level:.2f}")
+            self._log_adaptation("Increasing physics quality to %.2f", self.optimization_level)
             
+    def _log_adaptation(self, message: str, level: float):
+        """Log a quality change, at most once per _ADAPT_LOG_INTERVAL"""
+        now = time.monotonic()
+        if now - self._last_adapt_log >= _ADAPT_LOG_INTERVAL:
+            self._last_adapt_log = now
+            _LOG.debug(message, level)
+            
+    @property
+    def bodies(self) -> _BodyMap:
+        """Rigid bodies by id, as live views over the column storage"""
+        return _BodyMap(self)
+        
+    def get_rigid_body(self, body_id: str) -> RigidBodyView:
+        """Get a live view of a rigid body"""
+        if body_id not in self._index:
+            raise KeyError(body_id)
+        return RigidBodyView(self, body_id)
+        
     def add_rigid_body(self, body_id: str, body: RigidBody):
         """Add a rigid body to the simulation"""
-        self.bodies[body_id] = body
-        self.stats.bodies_count = len(self.bodies)
-        print(f"Added rigid body '{body_id}' to physics simulation")
+        if body_id in self._index:
+            self._remove_row(body_id)
+            
+        i = len(self.body_ids)
+        self._index[body_id] = i
+        self.body_ids.append(body_id)
+        self.pos.extend(body.position)
+        self.rot.extend(body.rotation)
+        self.vel.extend(body.velocity)
+        self.ang_vel.extend(body.angular_velocity)
+        self.mass.append(body.mass)
+        self.friction.append(body.friction)
+        self.restitution.append(body.restitution)
+        self.static_mask.append(body.is_static)
+        self.kinematic_mask.append(body.is_kinematic)
+        
+        # Move dynamic bodies into the dynamic block
+        if not body.is_static and not body.is_kinematic:
+            self._swap_rows(i, self._dynamic_count)
+            self._dynamic_count += 1
+        
+        self.stats.bodies_count = len(self.body_ids)
+        _LOG.debug("Added rigid body '%s' to physics simulation", body_id)
         
     def remove_rigid_body(self, body_id: str):
         """Remove a rigid body from the simulation"""
-        if body_id in self.bodies:
-            del self.bodies[body_id]
-            self.stats.bodies_count = len(self.bodies)
-            print(f"Removed rigid body '{body_id}' from physics simulation")
+        if body_id in self._index:
+            self._remove_row(body_id)
+            self.stats.bodies_count = len(self.body_ids)
+            _LOG.debug("Removed rigid body '%s' from physics simulation", body_id)
+            
+    def set_static(self, body_id: str, is_static: bool):
+        """Mark a rigid body as static or not"""
+        self._set_body_flag(body_id, "static_mask", is_static)
+        
+    def set_kinematic(self, body_id: str, is_kinematic: bool):
+        """Mark a rigid body as kinematic or not"""
+        self._set_body_flag(body_id, "kinematic_mask", is_kinematic)
+        
+    def _set_body_flag(self, body_id: str, column: str, value: bool):
+        """Set a static/kinematic flag and keep the dynamic block partitioned"""
+        i = self._index[body_id]
+        was_dynamic = i < self._dynamic_count
+        getattr(self, column)[i] = bool(value)
+        is_dynamic = not self.static_mask[i] and not self.kinematic_mask[i]
+        if was_dynamic and not is_dynamic:
+            self._dynamic_count -= 1
+            self._swap_rows(i, self._dynamic_count)
+        elif is_dynamic and not was_dynamic:
+            self._swap_rows(i, self._dynamic_count)
+            self._dynamic_count += 1
+            
+    def _swap_rows(self, i: int, j: int):
+        """Exchange two bodies' rows in every column"""
+        if i == j:
+            return
+        ids = self.body_ids
+        ids[i], ids[j] = ids[j], ids[i]
+        self._index[ids[i]] = i
+        self._index[ids[j]] = j
+        a, b = 3 * i, 3 * j
+        for col in (self.pos, self.rot, self.vel, self.ang_vel):
+            row = col[a:a + 3]
+            col[a:a + 3] = col[b:b + 3]
+            col[b:b + 3] = row
+        for col in (self.mass, self.friction, self.restitution, self.static_mask, self.kinematic_mask):
+            col[i], col[j] = col[j], col[i]
+            
+    def _remove_row(self, body_id: str):
+        """Remove a body's row by swapping it to the end, keeping the dynamic block packed"""
+        i = self._index[body_id]
+        if i < self._dynamic_count:
+            # Fill the hole with the last dynamic row first
+            self._dynamic_count -= 1
+            self._swap_rows(i, self._dynamic_count)
+            i = self._dynamic_count
+        last = len(self.body_ids) - 1
+        self._swap_rows(i, last)
+        
+        del self._index[body_id]
+        self.body_ids.pop()
+        for col in (self.pos, self.rot, self.vel, self.ang_vel):
+            del col[3 * last:]
+        for col in (self.mass, self.friction, self.restitution, self.static_mask, self.kinematic_mask):
+            del col[last]
             
     def set_gravity(self, x: float, y: float, z: float):
         """Set gravity vector"""
         self.settings.gravity = (x, y, z)
-        print(f"Gravity set to ({x}, {y}, {z})")
+        self._recompute_step_constants()
+        _LOG.debug("Gravity set to (%s, %s, %s)", x, y, z)
+        
+    def set_simulation_rate(self, rate: int):
+        """Set the simulation rate in Hz"""
+        self.settings.simulation_rate = rate
+        self._recompute_step_constants()
+        
+    def _recompute_step_constants(self):
+        """Precompute the step duration and the velocity change gravity applies per step"""
+        step = 1.0 / self.settings.simulation_rate
+        self._target_step_time = step
+        self._gravity_dv = tuple(g * step for g in self.settings.gravity)
         
     def get_physics_stats(self) -> PhysicsStats:
         """Get current physics statistics"""
-        return self.stats.copy() if hasattr(self.stats, 'copy') else self.stats
+        return replace(self.stats)  # Snapshot; later updates do not change it
         
     def get_performance_rating(self) -> float:
         """Get physics performance rating (0.0 to 1.0)"""
-        if not self.step_times:
+        if not self._recent_step_times:
             return 1.0
             
-        recent_steps = self.step_times[-30:]
-        avg_step_time = sum(recent_steps) / len(recent_steps)
-        target_step_time = 1.0 / self.settings.simulation_rate
+        avg_step_time = self._recent_step_sum / len(self._recent_step_times)
+        target_step_time = self._target_step_time
         
         # Performance rating based on how close we are to target step time
         if avg_step_time <= 0:
@@ -301,6 +650,7 @@ class PhysicsSystem(EngineSystem):
 
 if __name__ == "__main__":
     # Example usage
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     physics = PhysicsSystem()
     physics.initialize()
     
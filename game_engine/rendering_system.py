@@ -5,10 +5,22 @@ Graphics rendering and optimization
 
 import time
 import random
+import logging
+from collections import deque
 from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from .engine_core import EngineSystem
 
+_LOG = logging.getLogger(__name__)
+
+# Minimum seconds between adaptive-quality log messages
+_ADAPT_LOG_INTERVAL = 1.0
+
+# Adaptive quality runs every _ADAPT_INTERVAL frames and only adjusts after
+# _ADAPT_CONFIRMATIONS consecutive evaluations agree (hysteresis)
+_ADAPT_INTERVAL = 30
+_ADAPT_CONFIRMATIONS = 3
+
 @dataclass
 class RenderSettings:
     resolution: Tuple[int, int] = (1920, 1080)
@@ -16,6 +28,7 @@ class RenderSettings:
     vsync: bool = True
     max_fps: int = 60
     quality_level: int = 3  # 1-5, where 5 is ultra
+    debug_simulate_load: bool = False  # Sleep and fake draw stats each frame for testing
     
 @dataclass
 class RenderStats:
@@ -39,15 +52,22 @@ class RenderingSystem(EngineSystem):
         # Self-improvement variables
         self.quality_adjustment_factor = 1.0
         self.adaptive_quality_enabled = True
-        self.frame_times = []
         self.max_frame_times = 100  # Keep last 100 frame times
+        self.frame_times = deque(maxlen=self.max_frame_times)
+        self._frame_time_sum = 0.0
+        self._recent_frame_times = deque(maxlen=30)  # Window for adaptation and rating
+        self._recent_frame_sum = 0.0
+        self._target_frame_time = 1.0 / self.settings.max_fps
+        self._last_adapt_log = float("-inf")  # time.monotonic() seconds
+        self._last_adapt_frame = 0
+        self._adapt_pressure = 0  # consecutive slow (+) or fast (-) evaluations
         
     def initialize(self):
         """Initialize the rendering system"""
-        print("Initializing Rendering System...")
-        print(f"  Resolution: {self.settings.resolution[0]}x{self.settings.resolution[1]}")
-        print(f"  Quality Level: {self.settings.quality_level}/5")
-        print(f"  VSync: {'Enabled' if self.settings.vsync else 'Disabled'}")
+        _LOG.info("Initializing Rendering System...")
+        _LOG.info("  Resolution: %sx%s", self.settings.resolution[0], self.settings.resolution[1])
+        _LOG.info("  Quality Level: %s/5", self.settings.quality_level)
+        _LOG.info("  VSync: %s", 'Enabled' if self.settings.vsync else 'Disabled')
         
         # Simulate loading shaders, textures, etc.
         self._load_shaders()
@@ -55,7 +75,7 @@ class RenderingSystem(EngineSystem):
         self._create_cameras()
         self._create_lights()
         
-        print("Rendering System initialized successfully")
+        _LOG.info("Rendering System initialized successfully")
         
     def _load_shaders(self):
         """Load rendering shaders"""
@@ -95,9 +115,15 @@ class RenderingSystem(EngineSystem):
     def update(self, delta_time: float):
         """Update the rendering system"""
         # Record frame time for adaptive quality
+        if len(self.frame_times) == self.frame_times.maxlen:
+            self._frame_time_sum -= self.frame_times[0]
         self.frame_times.append(delta_time)
-        if len(self.frame_times) > self.max_frame_times:
-            self.frame_times.pop(0)
+        self._frame_time_sum += delta_time
+        recent = self._recent_frame_times
+        if len(recent) == recent.maxlen:
+            self._recent_frame_sum -= recent[0]
+        recent.append(delta_time)
+        self._recent_frame_sum += delta_time
             
         # Perform rendering
         self._render_frame()
@@ -108,10 +134,14 @@ class RenderingSystem(EngineSystem):
             
         # Update statistics
         self.stats.frames_rendered += 1
-        self.stats.avg_frame_time = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0
+        self.stats.avg_frame_time = self._frame_time_sum / len(self.frame_times)
         
     def _render_frame(self):
         """Render a single frame"""
+        # No graphics backend is wired in yet, so there is no real work to do
+        if not self.settings.debug_simulate_load:
+            return
+            
         # Simulate rendering work
         render_time = random.uniform(0.005, 0.02)  # 5-20ms
         time.sleep(render_time)
@@ -122,55 +152,80 @@ class RenderingSystem(EngineSystem):
         
     def _adapt_quality(self):
         """Adapt rendering quality based on performance"""
-        if len(self.frame_times) < 30:  # Need at least 30 frames
+        frames = self.stats.frames_rendered
+        if frames - self._last_adapt_frame < _ADAPT_INTERVAL or len(self._recent_frame_times) < 30:  # Need at least 30 frames
             return
+        self._last_adapt_frame = frames
             
         # Calculate average frame time of recent frames
-        recent_frames = self.frame_times[-30:]
-        avg_frame_time = sum(recent_frames) / len(recent_frames)
-        target_frame_time = 1.0 / self.settings.max_fps
+        avg_frame_time = self._recent_frame_sum / len(self._recent_frame_times)
+        target_frame_time = self._target_frame_time
         
-        # Adjust quality if we're not meeting target
+        # Require several consecutive evaluations on the same side of the deadband
         if avg_frame_time > target_frame_time * 1.1:  # 10% over target
+            self._adapt_pressure = max(1, self._adapt_pressure + 1)
+        elif avg_frame_time < target_frame_time * 0.9:  # 10% under target
+            self._adapt_pressure = min(-1, self._adapt_pressure - 1)
+        else:
+            self._adapt_pressure = 0
+        if abs(self._adapt_pressure) < _ADAPT_CONFIRMATIONS:
+            return
+        slow = self._adapt_pressure > 0
+        self._adapt_pressure = 0
+        
+        # Adjust quality if we're not meeting target
+        if slow:
             # Reduce quality
             self.quality_adjustment_factor = max(0.5, self.quality_adjustment_factor - 0.05)
-            print(f"Reducing rendering quality to {self.quality_adjustment_factor:.2f}")
-        elif avg_frame_time < target_frame_time * 0.9:  # 10% under target
+            self._log_adaptation("Reducing rendering quality to %.2f", self.quality_adjustment_factor)
+        else:
             # Increase quality
             self.quality_adjustment_factor = min(1.5, self.quality_adjustment_factor + 0.02)
-            print(f"Increasing rendering quality to {self.quality_adjustment_factor:.2f}")
+            self._log_adaptation("Increasing rendering quality to %.2f", self.quality_adjustment_factor)
+            
+    def _log_adaptation(self, message: str, factor: float):
+        """Log a quality change, at most once per _ADAPT_LOG_INTERVAL"""
+        now = time.monotonic()
+        if now - self._last_adapt_log >= _ADAPT_LOG_INTERVAL:
+            self._last_adapt_log = now
+            _LOG.debug(message, factor)
             
     def set_quality_level(self, level: int):
         """Set rendering quality level (1-5)"""
         if 1 <= level <= 5:
             self.settings.quality_level = level
-            print(f"Rendering quality level set to {level}")
+            _LOG.debug("Rendering quality level set to %s", level)
         else:
-            print("Quality level must be between 1 and 5")
+            _LOG.warning("Quality level must be between 1 and 5")
             
+    def set_max_fps(self, max_fps: int):
+        """Set the target frame rate"""
+        self.settings.max_fps = max_fps
+        self._target_frame_time = 1.0 / max_fps
+        _LOG.debug("Rendering target frame rate set to %s FPS", max_fps)
+        
     def set_resolution(self, width: int, height: int):
         """Set rendering resolution"""
         self.settings.resolution = (width, height)
-        print(f"Rendering resolution set to {width}x{height}")
+        _LOG.debug("Rendering resolution set to %sx%s", width, height)
         
     def toggle_fullscreen(self):
         """Toggle fullscreen mode"""
         self.settings.fullscreen = not self.settings.fullscreen
         mode = "fullscreen" if self.settings.fullscreen else "windowed"
-        print(f"Rendering mode set to {mode}")
+        _LOG.debug("Rendering mode set to %s", mode)
         
     def get_render_stats(self) -> RenderStats:
         """Get current rendering statistics"""
-        return self.stats.copy() if hasattr(self.stats, 'copy') else self.stats
+        return replace(self.stats)  # Snapshot; later updates do not change it
         
     def get_performance_rating(self) -> float:
         """Get rendering performance rating (0.0 to 1.0)"""
-        if not self.frame_times:
+        if not self._recent_frame_times:
             return 1.0
             
-        recent_frames = self.frame_times[-30:]
-        avg_frame_time = sum(recent_frames) / len(recent_frames)
-        target_frame_time = 1.0 / self.settings.max_fps
+        avg_frame_time = self._recent_frame_sum / len(self._recent_frame_times)
+        target_frame_time = self._target_frame_time
         
         # Performance rating based on how close we are to target frame time
         if avg_frame_time <= 0:
@@ -181,6 +236,7 @@ class RenderingSystem(EngineSystem):
 
 if __name__ == "__main__":
     # Example usage
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     renderer = RenderingSystem()
     renderer.initialize()
     
@@ -6,13 +6,17 @@ Machine learning and optimization for autonomous engine enhancement
 import time
 import random
 import math
-import json
-import hashlib
-from typing import Dict, List, Tuple, Any, Callable
-from dataclasses import dataclass, field
+import logging
+from array import array
+from collections import deque
+from itertools import chain
+from typing import Dict, List, Tuple, Any, Callable, Deque, Iterable, Iterator, Optional, Sequence
+from dataclasses import dataclass, field, asdict, replace
 from .engine_core import EngineSystem
 
-@dataclass
+_LOG = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class ImprovementSettings:
     learning_rate: float = 0.01
     adaptation_interval: float = 10.0  # seconds
@@ -20,9 +24,10 @@ class ImprovementSettings:
     optimization_threshold: float = 0.8  # 80% performance threshold
     enable_autonomous_optimization: bool = True
     enable_predictive_optimization: bool = True
-    max_optimization_attempts: int = 10
+    max_optimization_attempts: int = 10  # Queued optimizations applied per update
+    debug_simulate_work: bool = False  # Sleep to mimic optimization and training time for testing
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
     timestamp: float
     system_name: str
@@ -31,7 +36,125 @@ class PerformanceMetric:
     target: float
     weight: float = 1.0
 
-@dataclass
+def _intern(name: str, ids: Dict[str, int], names: List[str]) -> int:
+    """Return the small integer id for name, assigning the next one if new"""
+    index = ids.get(name)
+    if index is None:
+        index = ids[name] = len(names)
+        names.append(name)
+    return index
+
+class PerfRingBuffer:
+    """Fixed-capacity performance history stored as parallel columns"""
+    __slots__ = ("capacity", "timestamp", "value", "target", "weight", "system_id", "metric_id",
+                 "system_names", "metric_names", "_system_ids", "_metric_ids",
+                 "cursor", "size", "generation")
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamp = array('d', bytes(8 * capacity))
+        self.value = array('d', bytes(8 * capacity))
+        self.target = array('d', bytes(8 * capacity))
+        self.weight = array('d', bytes(8 * capacity))
+        self.system_id = array('l', [0]) * capacity
+        self.metric_id = array('l', [0]) * capacity
+        
+        # Interned system and metric names, indexed by id
+        self.system_names: List[str] = []
+        self.metric_names: List[str] = []
+        self._system_ids: Dict[str, int] = {}
+        self._metric_ids: Dict[str, int] = {}
+        
+        self.cursor = 0  # Next slot to write
+        self.size = 0
+        self.generation = 0  # Bumped on every change, for caching derived results
+        
+    def __len__(self) -> int:
+        return self.size
+        
+    def __iter__(self) -> Iterator[PerformanceMetric]:
+        """Yield every stored entry as a PerformanceMetric, oldest first"""
+        for i in self.recent(self.size):
+            yield PerformanceMetric(
+                timestamp=self.timestamp[i],
+                system_name=self.system_names[self.system_id[i]],
+                metric_name=self.metric_names[self.metric_id[i]],
+                value=self.value[i],
+                target=self.target[i],
+                weight=self.weight[i]
+            )
+            
+    def append(self, timestamp: float, system_name: str, metric_name: str,
+               value: float, target: float, weight: float):
+        """Write one entry, overwriting the oldest once full"""
+        # Names are almost always known already, so try the id maps before calling _intern
+        system_id = self._system_ids.get(system_name)
+        if system_id is None:
+            system_id = _intern(system_name, self._system_ids, self.system_names)
+        metric_id = self._metric_ids.get(metric_name)
+        if metric_id is None:
+            metric_id = _intern(metric_name, self._metric_ids, self.metric_names)
+            
+        i = self.cursor
+        self.timestamp[i] = timestamp
+        self.system_id[i] = system_id
+        self.metric_id[i] = metric_id
+        self.value[i] = value
+        self.target[i] = target
+        self.weight[i] = weight
+        
+        self.cursor = (i + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+        self.generation += 1
+            
+    def extend(self, timestamp: float, system_names: Sequence[str], metric_names: Sequence[str],
+               values: Sequence[float], targets: Sequence[float], weight: float):
+        """Write a batch of entries sharing one timestamp and weight, a slice per column"""
+        if not len(system_names) == len(metric_names) == len(targets) == len(values):
+            raise ValueError("batch sequences must all have the same length")
+            
+        # Only the newest capacity entries would survive; they land where
+        # appending the whole batch one by one would have put them
+        skip = max(0, len(values) - self.capacity)
+        count = len(values) - skip
+        system_ids = [_intern(name, self._system_ids, self.system_names) for name in system_names][skip:]
+        metric_ids = [_intern(name, self._metric_ids, self.metric_names) for name in metric_names][skip:]
+        columns = (
+            (self.timestamp, array('d', [timestamp]) * count),
+            (self.system_id, array('l', system_ids)),
+            (self.metric_id, array('l', metric_ids)),
+            (self.value, array('d', values[skip:])),
+            (self.target, array('d', targets[skip:])),
+            (self.weight, array('d', [weight]) * count)
+        )
+        
+        # Fill to the end of the buffer, then wrap around to the start
+        start = (self.cursor + skip) % self.capacity
+        first = min(count, self.capacity - start)
+        for column, data in columns:
+            column[start:start + first] = data[:first]
+            column[:count - first] = data[first:]
+            
+        self.cursor = (start + count) % self.capacity
+        self.size = min(self.capacity, self.size + count)
+        self.generation += 1
+        
+    def recent(self, count: int) -> Iterable[int]:
+        """Slot indices of the newest count entries, oldest first"""
+        count = min(count, self.size)
+        start = self.cursor - count
+        if start >= 0:
+            return range(start, self.cursor)
+        return chain(range(start + self.capacity, self.capacity), range(self.cursor))
+        
+    def clear(self):
+        """Forget all entries (interned names are kept)"""
+        self.cursor = 0
+        self.size = 0
+        self.generation += 1
+
+@dataclass(slots=True)
 class OptimizationStrategy:
     name: str
     description: str
@@ -40,7 +163,7 @@ class OptimizationStrategy:
     last_applied: float = 0.0
     application_count: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class ImprovementStats:
     learning_cycles: int = 0
     optimizations_applied: int = 0
@@ -49,15 +172,32 @@ class ImprovementStats:
     avg_improvement_rate: float = 0.0
     total_improvement: float = 0.0
 
+# Optimization strategy used for bottlenecks in each system
+_SYSTEM_TO_STRATEGY = {
+    "renderer": "rendering_quality_adjustment",
+    "physics": "physics_complexity_reduction",
+    "ai_behavior": "ai_behavior_optimization",
+    "content_generator": "content_generation_caching",
+    "networking": "network_packet_rate_adjustment"
+}
+
 class SelfImprovementSystem(EngineSystem):
     def __init__(self):
         self.settings = ImprovementSettings()
         self.stats = ImprovementStats()
         
         # Performance tracking
-        self.performance_history: List[PerformanceMetric] = []
-        self.system_baselines: Dict[str, Dict[str, float]] = {}
-        self.performance_trends: Dict[str, List[float]] = {}
+        self.performance_history = PerfRingBuffer(self.settings.performance_history_size)
+        
+        # Baselines as a row-major (system id, metric id) matrix; NaN marks no baseline yet
+        self._baseline_shape = (16, 8)
+        self._baselines = array('d', [math.nan]) * (16 * 8)
+        self.performance_trends: Dict[str, Deque[float]] = {}
+        self._trend_window_sums: Dict[str, List[float]] = {}  # [newest 5 sum, previous 5 sum]
+        
+        # Analysis results cached against the history generation they were computed from
+        self._analysis_cache: Tuple[int, Dict[str, Any]] = (-1, {})
+        self._rating_cache: Tuple[int, float] = (-1, 1.0)
         
         # Optimization strategies
         self.optimization_strategies: List[OptimizationStrategy] = []
@@ -68,9 +208,10 @@ class SelfImprovementSystem(EngineSystem):
         self.adaptation_models = {}
         
         # Self-improvement components
+        self._rng = random.Random()
         self.last_adaptation_time = 0.0
         self.improvement_suggestions = []
-        self.optimization_queue = []
+        self.optimization_queue: Deque[Dict[str, Any]] = deque()
         self.experiment_results = {}
         
         # Initialize default strategies
@@ -78,16 +219,16 @@ class SelfImprovementSystem(EngineSystem):
         
     def initialize(self):
         """Initialize the self-improvement system"""
-        print("Initializing Self-Improvement System...")
-        print(f"  Learning Rate: {self.settings.learning_rate}")
-        print(f"  Adaptation Interval: {self.settings.adaptation_interval}s")
-        print(f"  Autonomous Optimization: {'Enabled' if self.settings.enable_autonomous_optimization else 'Disabled'}")
-        print(f"  Predictive Optimization: {'Enabled' if self.settings.enable_predictive_optimization else 'Disabled'}")
+        _LOG.info("Initializing Self-Improvement System...")
+        _LOG.info("  Learning Rate: %s", self.settings.learning_rate)
+        _LOG.info("  Adaptation Interval: %ss", self.settings.adaptation_interval)
+        _LOG.info("  Autonomous Optimization: %s", 'Enabled' if self.settings.enable_autonomous_optimization else 'Disabled')
+        _LOG.info("  Predictive Optimization: %s", 'Enabled' if self.settings.enable_predictive_optimization else 'Disabled')
         
         # Initialize machine learning models
         self._initialize_ml_models()
         
-        print("Self-Improvement System initialized successfully")
+        _LOG.info("Self-Improvement System initialized successfully")
         
     def _initialize_optimization_strategies(self):
         """Initialize default optimization strategies"""
@@ -144,6 +285,11 @@ class SelfImprovementSystem(EngineSystem):
             )
         ]
         
+        # Index by name for strategy selection; the first strategy with a name wins
+        self._strategy_by_name: Dict[str, OptimizationStrategy] = {}
+        for strategy in self.optimization_strategies:
+            self._strategy_by_name.setdefault(strategy.name, strategy)
+            
     def _initialize_ml_models(self):
         """Initialize machine learning models for prediction and adaptation"""
         # In a real implementation, this would initialize actual ML models
@@ -153,14 +299,16 @@ class SelfImprovementSystem(EngineSystem):
         self.adaptation_models["parameter_optimizer"] = "Parameter optimization model"
         self.adaptation_models["strategy_selector"] = "Strategy selection model"
         
-        print("Machine learning models initialized")
+        _LOG.info("Machine learning models initialized")
         
     def update(self, delta_time: float):
         """Update the self-improvement system"""
         current_time = time.time()
+        settings = self.settings
         
-        # Perform periodic adaptation
-        if current_time - self.last_adaptation_time > self.settings.adaptation_interval:
+        # Perform periodic adaptation; its history sweep also updates trends
+        adapted = current_time - self.last_adaptation_time > settings.adaptation_interval
+        if adapted:
             self._perform_adaptation()
             self.last_adaptation_time = current_time
             
@@ -168,51 +316,50 @@ class SelfImprovementSystem(EngineSystem):
         self._process_optimization_queue()
         
         # Update performance trends
-        self._update_performance_trends()
-        
+        if not adapted:
+            self._update_performance_trends()
+            
         # Generate improvement suggestions
-        if self.settings.enable_autonomous_optimization:
+        if settings.enable_autonomous_optimization:
             self._generate_improvement_suggestions()
             
     def _perform_adaptation(self):
         """Perform system adaptation based on performance data"""
         self.stats.learning_cycles += 1
-        print(f"Performing adaptation cycle #{self.stats.learning_cycles}")
+        _LOG.debug("Performing adaptation cycle #%d", self.stats.learning_cycles)
         
-        # Analyze performance data
-        performance_analysis = self._analyze_performance()
+        # Analyze performance data, updating trends and baselines in the same pass
+        performance_analysis = self._analyze_performance(update_trends=True, update_baselines=True)
         
         # Apply optimizations if needed
         if performance_analysis["overall_performance"] < self.settings.optimization_threshold:
             self._apply_optimizations(performance_analysis)
             
-        # Update system baselines
-        self._update_baselines()
-        
         # Train ML models with new data
         self._train_models()
         
-    def _analyze_performance(self) -> Dict[str, Any]:
+    def _analyze_performance(self, update_trends: bool = False,
+                             update_baselines: bool = False) -> Dict[str, Any]:
         """Analyze system performance and identify bottlenecks"""
-        if len(self.performance_history) < 10:
+        history = self.performance_history
+        if len(history) < 10:
             return {"overall_performance": 1.0, "bottlenecks": []}
             
-        # Get recent performance metrics
-        recent_metrics = self.performance_history[-100:]
-        
-        # Calculate performance by system
-        system_performance = {}
-        bottlenecks = []
-        
-        for metric in recent_metrics:
-            if metric.system_name not in system_performance:
-                system_performance[metric.system_name] = []
-            system_performance[metric.system_name].append(metric.value / metric.target)
+        # Reuse the last result while the history is unchanged, unless the sweep
+        # must also update trends or baselines
+        generation, cached = self._analysis_cache
+        if generation == history.generation and not (update_trends or update_baselines):
+            return cached
             
-        # Calculate average performance for each system
+        # Average performance of recent metrics for each system
+        overall_performance, averages = self._adaptation_sweep(100, update_trends, update_baselines)
+        
         system_averages = {}
-        for system, values in system_performance.items():
-            avg_performance = sum(values) / len(values)
+        bottlenecks = []
+        for sid, avg_performance in enumerate(averages):
+            if avg_performance is None:
+                continue
+            system = history.system_names[sid]
             system_averages[system] = avg_performance
             
             # Identify bottlenecks
@@ -223,14 +370,119 @@ class SelfImprovementSystem(EngineSystem):
                     "severity": "high" if avg_performance < 0.5 else "medium"
                 })
                 
-        # Calculate overall performance
-        overall_performance = sum(system_averages.values()) / len(system_averages) if system_averages else 1.0
-        
-        return {
+        result = {
             "overall_performance": overall_performance,
             "system_performance": system_averages,
             "bottlenecks": bottlenecks
         }
+        self._analysis_cache = (history.generation, result)
+        return result
+        
+    def _adaptation_sweep(self, window: int, update_trends: bool,
+                          update_baselines: bool) -> Tuple[float, List[Optional[float]]]:
+        """Scan the newest window entries once for per-system averages, trends and baselines"""
+        history = self.performance_history
+        value, target = history.value, history.target
+        system_id, metric_id = history.system_id, history.metric_id
+        system_names = history.system_names
+        
+        # Trends take the newest 50 entries, baselines the newest 100
+        size = len(history)
+        count = min(window, size)
+        trend_from = count - 50 if update_trends and size >= 50 else count
+        update_baselines = update_baselines and size >= 100
+        if update_baselines:
+            self._ensure_baseline_shape(len(system_names), len(history.metric_names))
+        baselines = self._baselines
+        stride = self._baseline_shape[1]
+        
+        # Name-keyed trend deques and window sums, resolved once per system id
+        n_sys = len(system_names)
+        sid_trends: List[Optional[Tuple[Deque[float], List[float]]]] = [None] * n_sys
+        
+        sums = [0.0] * n_sys
+        counts = [0] * n_sys
+        for n, i in enumerate(history.recent(count)):
+            sid = system_id[i]
+            ratio = value[i] / target[i]
+            sums[sid] += ratio
+            counts[sid] += 1
+            
+            if n >= trend_from:
+                entry = sid_trends[sid]
+                if entry is None:
+                    entry = sid_trends[sid] = self._system_trends(system_names[sid])
+                system_trends, window_sums = entry
+                
+                # Roll the newest-5 and previous-5 window sums forward
+                n_trends = len(system_trends)
+                if n_trends >= 5:
+                    shifted = system_trends[-5]
+                    window_sums[0] += ratio - shifted
+                    window_sums[1] += shifted - (system_trends[-10] if n_trends >= 10 else 0.0)
+                else:
+                    window_sums[0] += ratio
+                system_trends.append(ratio)
+                
+            if update_baselines:
+                # Update baseline with weighted average
+                k = sid * stride + metric_id[i]
+                current_baseline = baselines[k]
+                if current_baseline != current_baseline:  # NaN: start from the target
+                    current_baseline = target[i]
+                baselines[k] = (current_baseline * 0.9) + (value[i] * 0.1)
+                
+        # Per-system means, and the mean of those for overall performance
+        averages: List[Optional[float]] = [None] * n_sys
+        total = 0.0
+        seen = 0
+        for sid in range(n_sys):
+            if counts[sid]:
+                averages[sid] = avg = sums[sid] / counts[sid]
+                total += avg
+                seen += 1
+        return (total / seen if seen else 1.0), averages
+        
+    def _ensure_baseline_shape(self, n_sys: int, n_metric: int):
+        """Grow the baseline matrix, doubling each dimension, to fit the given ids"""
+        rows, cols = self._baseline_shape
+        if n_sys <= rows and n_metric <= cols:
+            return
+            
+        new_rows, new_cols = rows, cols
+        while new_rows < n_sys:
+            new_rows *= 2
+        while new_cols < n_metric:
+            new_cols *= 2
+            
+        grown = array('d', [math.nan]) * (new_rows * new_cols)
+        for row in range(rows):
+            grown[row * new_cols:row * new_cols + cols] = self._baselines[row * cols:(row + 1) * cols]
+        self._baselines = grown
+        self._baseline_shape = (new_rows, new_cols)
+        
+    @property
+    def system_baselines(self) -> Dict[str, Dict[str, float]]:
+        """Baselines by system and metric name"""
+        history = self.performance_history
+        stride = self._baseline_shape[1]
+        result = {}
+        for sid, system in enumerate(history.system_names[:self._baseline_shape[0]]):
+            row = sid * stride
+            for mid, metric_name in enumerate(history.metric_names[:stride]):
+                baseline = self._baselines[row + mid]
+                if baseline == baseline:
+                    result.setdefault(system, {})[metric_name] = baseline
+        return result
+        
+    def _system_trends(self, system: str) -> Tuple[Deque[float], List[float]]:
+        """Return the trend deque and window sums for a system, creating them on first use"""
+        system_trends = self.performance_trends.get(system)
+        if system_trends is None:
+            # Keep only the 100 most recent trend values
+            system_trends = self.performance_trends[system] = deque(maxlen=100)
+            self._trend_window_sums[system] = [0.0, 0.0]
+        return system_trends, self._trend_window_sums[system]
         
     def _apply_optimizations(self, performance_analysis: Dict[str, Any]):
         """Apply optimizations based on performance analysis"""
@@ -251,59 +503,45 @@ class SelfImprovementSystem(EngineSystem):
                     "timestamp": time.time()
                 })
                 
-    def _select_optimization_strategy(self, system: str, severity: str) -> OptimizationStrategy:
+    def _select_optimization_strategy(self, system: str, severity: str) -> Optional[OptimizationStrategy]:
         """Select appropriate optimization strategy for a system"""
-        # Match system to strategy
-        strategy_mapping = {
-            "renderer": "rendering_quality_adjustment",
-            "physics": "physics_complexity_reduction",
-            "ai_behavior": "ai_behavior_optimization",
-            "content_generator": "content_generation_caching",
-            "networking": "network_packet_rate_adjustment"
-        }
-        
-        strategy_name = strategy_mapping.get(system)
+        strategy_name = _SYSTEM_TO_STRATEGY.get(system)
         if not strategy_name:
             return None
-            
-        # Find strategy by name
-        for strategy in self.optimization_strategies:
-            if strategy.name == strategy_name:
-                return strategy
-                
-        return None
+        return self._strategy_by_name.get(strategy_name)
         
     def _process_optimization_queue(self):
         """Process queued optimizations"""
-        if not self.optimization_queue:
-            return
+        queue = self.optimization_queue
+        
+        # Process up to max_optimization_attempts optimizations per update cycle
+        for _ in range(min(self.settings.max_optimization_attempts, len(queue))):
+            optimization = queue.popleft()
+            strategy = optimization["strategy"]
             
-        # Process one optimization per update cycle
-        optimization = self.optimization_queue.pop(0)
-        strategy = optimization["strategy"]
-        
-        # Apply optimization
-        success = self._apply_optimization_strategy(strategy, optimization)
-        
-        # Update statistics
-        if success:
-            self.stats.optimizations_applied += 1
-            strategy.application_count += 1
-            strategy.last_applied = time.time()
-            print(f"Applied optimization: {strategy.name}")
-        else:
-            self.stats.failed_optimizations += 1
-            print(f"Failed to apply optimization: {strategy.name}")
+            # Apply optimization
+            success = self._apply_optimization_strategy(strategy, optimization)
             
+            # Update statistics
+            if success:
+                self.stats.optimizations_applied += 1
+                strategy.application_count += 1
+                strategy.last_applied = time.time()
+                _LOG.debug("Applied optimization: %s", strategy.name)
+            else:
+                self.stats.failed_optimizations += 1
+                _LOG.debug("Failed to apply optimization: %s", strategy.name)
+                
     def _apply_optimization_strategy(self, strategy: OptimizationStrategy, context: Dict) -> bool:
         """Apply a specific optimization strategy"""
         try:
             # In a real implementation, this would actually modify system parameters
             # For now, we'll simulate the process
-            time.sleep(0.01)  # Simulate optimization time
-            
+            if self.settings.debug_simulate_work:
+                time.sleep(0.01)  # Simulate optimization time
+                
             # Update strategy effectiveness based on random success
-            success = random.random() > 0.3  # 70% success rate
+            success = self._rng.random() > 0.3  # 70% success rate
             if success:
                 strategy.effectiveness = min(1.0, strategy.effectiveness + 0.1)
             else:
@@ -311,7 +549,7 @@ class SelfImprovementSystem(EngineSystem):
                 
             return True
         except Exception as e:
-            print(f"Error applying optimization strategy {strategy.name}: {e}")
+            _LOG.warning("Error applying optimization strategy %s: %s", strategy.name, e)
             return False
             
     def _update_performance_trends(self):
@@ -319,21 +557,8 @@ class SelfImprovementSystem(EngineSystem):
         if len(self.performance_history) < 50:
             return
             
-        # Calculate trends for each system
-        recent_metrics = self.performance_history[-50:]
+        self._adaptation_sweep(50, update_trends=True, update_baselines=False)
         
-        for metric in recent_metrics:
-            system = metric.system_name
-            if system not in self.performance_trends:
-                self.performance_trends[system] = []
-                
-            performance_ratio = metric.value / metric.target
-            self.performance_trends[system].append(performance_ratio)
-            
-            # Keep only recent trends
-            if len(self.performance_trends[system]) > 100:
-                self.performance_trends[system].pop(0)
-                
     def _generate_improvement_suggestions(self):
         """Generate suggestions for system improvements"""
         # Clear previous suggestions
@@ -344,9 +569,10 @@ class SelfImprovementSystem(EngineSystem):
             if len(trends) < 10:
                 continue
                 
-            # Calculate trend direction
-            recent_trend = sum(trends[-5:]) / 5
-            older_trend = sum(trends[-10:-5]) / 5
+            # Calculate trend direction from the running window sums
+            recent_sum, older_sum = self._trend_window_sums[system]
+            recent_trend = recent_sum / 5
+            older_trend = older_sum / 5
             
             # If performance is declining, suggest improvements
             if recent_trend < older_trend * 0.9:  # 10% decline
@@ -364,21 +590,8 @@ class SelfImprovementSystem(EngineSystem):
         if len(self.performance_history) < 100:
             return
             
-        # Calculate new baselines from recent performance
-        recent_metrics = self.performance_history[-100:]
+        self._adaptation_sweep(100, update_trends=False, update_baselines=True)
         
-        for metric in recent_metrics:
-            system = metric.system_name
-            metric_name = metric.metric_name
-            
-            if system not in self.system_baselines:
-                self.system_baselines[system] = {}
-                
-            # Update baseline with weighted average
-            current_baseline = self.system_baselines[system].get(metric_name, metric.target)
-            new_baseline = (current_baseline * 0.9) + (metric.value * 0.1)
-            self.system_baselines[system][metric_name] = new_baseline
-            
     def _train_models(self):
         """Train machine learning models with new performance data"""
         if len(self.performance_history) < 50:
@@ -386,52 +599,54 @@ class SelfImprovementSystem(EngineSystem):
             
         # In a real implementation, this would train actual ML models
         # For now, we'll just simulate the process
-        print("Training machine learning models...")
-        time.sleep(0.05)  # Simulate training time
-        print("ML models updated with new performance data")
+        _LOG.debug("Training machine learning models...")
+        if self.settings.debug_simulate_work:
+            time.sleep(0.05)  # Simulate training time
+        _LOG.debug("ML models updated with new performance data")
         
     def record_performance_metric(self, system_name: str, metric_name: str, 
                                 value: float, target: float, weight: float = 1.0):
         """Record a performance metric for analysis"""
-        metric = PerformanceMetric(
-            timestamp=time.time(),
-            system_name=system_name,
-            metric_name=metric_name,
-            value=value,
-            target=target,
-            weight=weight
-        )
-        
-        self.performance_history.append(metric)
-        
-        # Maintain history size
-        if len(self.performance_history) > self.settings.performance_history_size:
-            self.performance_history.pop(0)
+        # The ring buffer overwrites its oldest entry once full
+        self.performance_history.append(time.time(), system_name, metric_name,
+                                        value, target, weight)
             
+    def record_performance_metrics(self, system_names: Sequence[str], metric_names: Sequence[str],
+                                   values: Sequence[float], targets: Sequence[float],
+                                   weight: float = 1.0):
+        """Record a batch of performance metrics given as parallel sequences"""
+        self.performance_history.extend(time.time(), system_names, metric_names,
+                                        values, targets, weight)
+        
     def add_optimization_strategy(self, strategy: OptimizationStrategy):
         """Add a new optimization strategy"""
         self.optimization_strategies.append(strategy)
-        print(f"Added optimization strategy: {strategy.name}")
+        self._strategy_by_name.setdefault(strategy.name, strategy)
+        _LOG.debug("Added optimization strategy: %s", strategy.name)
         
     def get_improvement_stats(self) -> ImprovementStats:
         """Get current improvement statistics"""
-        return self.stats.copy() if hasattr(self.stats, 'copy') else self.stats
+        return replace(self.stats)
         
     def get_performance_rating(self) -> float:
         """Get self-improvement system performance rating (0.0 to 1.0)"""
-        if not self.performance_history:
+        history = self.performance_history
+        if not history:
             return 1.0
             
-        # Calculate based on recent performance metrics
-        recent_metrics = self.performance_history[-50:]
-        if not recent_metrics:
-            return 1.0
+        generation, rating = self._rating_cache
+        if generation == history.generation:
+            return rating
             
-        total_performance = sum(metric.value / metric.target for metric in recent_metrics)
-        avg_performance = total_performance / len(recent_metrics)
+        # Calculate based on recent performance metrics
+        value, target = history.value, history.target
+        recent = history.recent(50)
+        total_performance = sum(value[i] / target[i] for i in recent)
+        avg_performance = total_performance / min(50, len(history))
         
         # Normalize to 0.0-1.0 range
         rating = max(0.0, min(1.0, avg_performance))
+        self._rating_cache = (history.generation, rating)
         return rating
         
     def get_improvement_suggestions(self) -> List[Dict]:
@@ -442,26 +657,39 @@ class SelfImprovementSystem(EngineSystem):
         """Clear performance history"""
         self.performance_history.clear()
         self.performance_trends.clear()
-        print("Performance history cleared")
+        self._trend_window_sums.clear()
+        _LOG.debug("Performance history cleared")
         
     def export_performance_data(self, filename: str):
         """Export performance data to file"""
+        # json is only needed here, so keep it off the module import path
+        import json
+        
         try:
-            data = {
-                "settings": self.settings.__dict__,
-                "stats": self.stats.__dict__,
-                "performance_history": [
-                    {
-                        "timestamp": m.timestamp,
-                        "system_name": m.system_name,
-                        "metric_name": m.metric_name,
-                        "value": m.value,
-                        "target": m.target,
-                        "weight": m.weight
-                    }
-                    for m in self.performance_history
-                ],
-                "optimization_strategies": [
+            encode = json.JSONEncoder(ensure_ascii=False).encode
+            history = self.performance_history
+            names = history.system_names
+            metric_names = history.metric_names
+            
+            # Stream history rows straight from the ring buffer columns rather
+            # than building the whole document in memory first
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write('{"settings": ' + encode(asdict(self.settings)))
+                f.write(', "stats": ' + encode(asdict(self.stats)))
+                f.write(', "performance_history": [')
+                for n, i in enumerate(history.recent(len(history))):
+                    if n:
+                        f.write(', ')
+                    f.write(encode({
+                        "timestamp": history.timestamp[i],
+                        "system_name": names[history.system_id[i]],
+                        "metric_name": metric_names[history.metric_id[i]],
+                        "value": history.value[i],
+                        "target": history.target[i],
+                        "weight": history.weight[i]
+                    }))
+                f.write('], "optimization_strategies": ')
+                f.write(encode([
                     {
                         "name": s.name,
                         "description": s.description,
@@ -471,19 +699,17 @@ class SelfImprovementSystem(EngineSystem):
                         "application_count": s.application_count
                     }
                     for s in self.optimization_strategies
-                ]
-            }
-            
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+                ]))
+                f.write('}')
                 
-            print(f"Performance data exported to {filename}")
+            _LOG.info("Performance data exported to %s", filename)
             
         except Exception as e:
-            print(f"Error exporting performance data: {e}")
+            _LOG.warning("Error exporting performance data: %s", e)
 
 if __name__ == "__main__":
     # Example usage
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     improvement_system = SelfImprovementSystem()
     improvement_system.initialize()
     
@@ -493,25 +719,16 @@ if __name__ == "__main__":
     
     print("Recording sample performance metrics...")
     
-    for i in range(100):
-        system = random.choice(systems)
-        metric = random.choice(metrics)
-        
-        # Simulate varying performance
-        target = random.uniform(0.01, 0.1)  # Target time
-        value = target * random.uniform(0.5, 1.5)  # Actual time with some variance
-        
-        improvement_system.record_performance_metric(
-            system_name=system,
-            metric_name=metric,
-            value=value,
-            target=target
-        )
-        
-        # Update system occasionally
-        if i % 20 == 0:
-            improvement_system.update(0.1)
-            
+    # Draw all samples up front and record them as one batch
+    rng = random.Random()
+    sample_systems = rng.choices(systems, k=100)
+    sample_metrics = rng.choices(metrics, k=100)
+    targets = [rng.uniform(0.01, 0.1) for _ in range(100)]  # Target times
+    values = [target * rng.uniform(0.5, 1.5) for target in targets]  # Actual times with some variance
+    
+    improvement_system.record_performance_metrics(sample_systems, sample_metrics, values, targets)
+    improvement_system.update(0.1)
+    
     # Show statistics
     stats = improvement_system.get_improvement_stats()
     print(f"Self-Improvement Statistics:")